@@ -1,15 +1,19 @@
 import asyncio
 import logging
-from typing import AsyncGenerator, Optional, Callable, cast
+from typing import Any, AsyncGenerator, Optional, Callable, Tuple
 
 import numpy as np
 import pyaudio
-from numpy.typing import NDArray
+
+from src.audio_level import compute_level
 
 
 class AudioCapture:
     """Handles audio capture from the system's microphone."""
 
+    # Seconds between silent blocks when capture is disabled
+    silence_interval = 1.0
+
     def __init__(
         self,
         format: int = pyaudio.paFloat32,
@@ -19,57 +23,107 @@ class AudioCapture:
         level_callback: Optional[Callable[[bytes], None]] = None,
         logger: Optional[logging.Logger] = None,
         enabled: bool = False,
+        queue_size: int = 8,
     ):
         self.enabled = enabled
         self.format = format
         self.channels = channels
         self.rate = rate
         self.chunk = chunk
+        # Reused for every silent block, bytes are immutable. One block holds
+        # ten chunks so the data rate matches the former 100 ms wake-ups.
+        self._silence = b"\x00" * (chunk * 10)
         self.audio = pyaudio.PyAudio() if enabled else None
         self.stream: Optional[pyaudio.Stream] = None
         self.level_callback = level_callback
         self._running = False
         self.logger = logger or logging.getLogger(__name__)
+        # Frames are handed over from the PortAudio thread via the event loop.
+        # The queue is bounded so a stalled consumer drops old audio instead of
+        # accumulating latency.
+        self.queue_size = queue_size
+        self._queue: Optional[asyncio.Queue[bytes]] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _pa_callback(
+        self, in_data: Optional[bytes], frame_count: int, time_info: Any, status: int
+    ) -> Tuple[None, int]:
+        """PortAudio stream callback, runs on the PortAudio thread."""
+        loop = self._loop
+        if loop is not None and in_data:
+            try:
+                loop.call_soon_threadsafe(self._enqueue, in_data)
+            except RuntimeError:
+                # Event loop already closed, nothing left to deliver to
+                pass
+        return (None, pyaudio.paContinue)
+
+    def _enqueue(self, data: bytes) -> None:
+        """Put a chunk on the queue, dropping the oldest one when full."""
+        if self._queue is None:
+            return
+        if self._queue.full():
+            self._queue.get_nowait()
+        self._queue.put_nowait(data)
+
+    def _measure_level(self, data: bytes) -> Tuple[float, float]:
+        """Return (peak, rms) of a chunk, normalized to [0, 1]."""
+        if self.format == pyaudio.paFloat32:
+            return compute_level(np.frombuffer(data, dtype=np.float32))
+        if self.format == pyaudio.paInt16:
+            return compute_level(np.frombuffer(data, dtype=np.int16), 32768.0)
+        # Unsupported format
+        return 0.0, 0.0
 
     async def start_stream(self) -> AsyncGenerator[bytes, None]:
         """
         Starts capturing audio from the microphone and yields chunks of audio data.
-        If audio capture is disabled, yields empty chunks.
+        If audio capture is disabled, yields a block of silence every
+        silence_interval seconds.
         """
         if not self.enabled:
             self.logger.info("Audio capture is disabled")
             while True:
-                await asyncio.sleep(0.1)
-                yield b"\x00" * self.chunk
+                await asyncio.sleep(self.silence_interval)
+                yield self._silence
 
         if self.audio is None:
             self.logger.error("PyAudio not initialized")
             while True:
-                await asyncio.sleep(0.1)
-                yield b"\x00" * self.chunk
+                await asyncio.sleep(self.silence_interval)
+                yield self._silence
 
         self.logger.debug(
-            f"Starting stream with format={self.format}, rate={self.rate}, chunk={self.chunk}"
+            "Starting stream with format=%s, rate=%s, chunk=%s",
+            self.format,
+            self.rate,
+            self.chunk,
         )
+        loop = asyncio.get_running_loop()
+        self._loop = loop
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._running = True
         self.stream = self.audio.open(
             format=self.format,
             channels=self.channels,
             rate=self.rate,
             input=True,
             frames_per_buffer=self.chunk,
+            stream_callback=self._pa_callback,
         )
-        self._running = True
 
         last_log = 0.0
         log_interval = 1.0  # Log every second
+        now = loop.time
 
         while self._running:
             try:
-                if self.stream is None:
+                data = await self._queue.get()
+                if not data:
+                    # Empty chunk is the wake-up sentinel from stop_stream
                     break
 
-                data = self.stream.read(self.chunk, exception_on_overflow=False)
-                current_time = asyncio.get_event_loop().time()
+                current_time = now()
 
                 if self.level_callback:
                     try:
@@ -79,26 +133,13 @@ class AudioCapture:
 
                 # Log audio capture status periodically with data details
                 if current_time - last_log >= log_interval:
-                    # Convert bytes to numpy array based on format
-                    if self.format == pyaudio.paFloat32:
-                        samples = np.frombuffer(data, dtype=np.float32)
-                    elif self.format == pyaudio.paInt16:
-                        samples = cast(
-                            NDArray[np.float32],
-                            np.frombuffer(data, dtype=np.int16).astype(np.float32)
-                            / 32768.0,
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        max_sample, rms = self._measure_level(data)
+                        self.logger.debug(
+                            f"Audio chunk: peak={max_sample:.3f}, rms={rms:.3f}"
                         )
-                    else:
-                        samples = np.zeros(
-                            0, dtype=np.float32
-                        )  # Empty array for unsupported formats
-
-                    if len(samples) > 0:
-                        max_sample = float(np.max(np.abs(samples)))
-                        rms = float(np.sqrt(np.mean(samples**2)))
                     last_log = current_time
                 yield data
-                await asyncio.sleep(0.1)
             except Exception as e:
                 self.logger.error(f"Error reading audio: {e}")
                 break
@@ -109,10 +150,14 @@ class AudioCapture:
         if not self.enabled:
             return
 
+        # Wake up a consumer blocked on the queue
+        self._enqueue(b"")
+
         if self.stream:
             self.logger.debug("Stopping audio stream")
             self.stream.stop_stream()
             self.stream.close()
             self.stream = None
+        self._loop = None
         if self.audio:
             self.audio.terminate()
@@ -0,0 +1,34 @@
+import math
+from typing import Any, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+def compute_rms(samples: NDArray[Any], full_scale: float = 1.0) -> float:
+    """Return the rms of a sample buffer, divided by full_scale.
+
+    Integer samples are accumulated on int64 so they cannot overflow.
+    """
+    if samples.size == 0:
+        return 0.0
+
+    if samples.dtype.kind == "i":
+        ssq = float(np.einsum("i,i->", samples, samples, dtype=np.int64))
+    else:
+        ssq = float(np.dot(samples, samples))
+    return math.sqrt(ssq / samples.size) / full_scale
+
+
+def compute_level(
+    samples: NDArray[Any], full_scale: float = 1.0
+) -> Tuple[float, float]:
+    """Return (peak, rms) of a sample buffer, divided by full_scale.
+
+    Works directly on a ``np.frombuffer`` view without temporary copies.
+    """
+    if samples.size == 0:
+        return 0.0, 0.0
+
+    peak = max(float(samples.max()), -float(samples.min()))
+    return peak / full_scale, compute_rms(samples, full_scale)
@@ -1,8 +1,15 @@
 import os
-from typing import Dict, TypedDict, cast, Literal, Any
+from functools import cached_property
+from typing import Dict, FrozenSet, Tuple, TypedDict, cast, Literal, Any
 
 import yaml  # We don't need the type ignore comment anymore since we configured it in mypy.ini
 
+try:
+    # libyaml-backed loader, falls back to the pure-Python one if unavailable
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore[assignment]
+
 
 class AzureConfig(TypedDict):
     speech_key: str
@@ -36,7 +43,7 @@ class AudioConfig(TypedDict):
     format: int  # pyaudio format
     channels: int
     rate: int
-    chunk: int
+    chunk: int  # frames per buffer, trades latency for callback rate
 
 
 class OpenAIConfig(TypedDict):
@@ -56,6 +63,8 @@ class AppConfig(TypedDict):
 
 
 PathName = Literal["logs", "meetings", "screenshots"]
+PATH_NAMES: Tuple[PathName, ...] = ("logs", "meetings", "screenshots")
+_PATH_NAME_SET: FrozenSet[str] = frozenset(PATH_NAMES)
 
 
 class Config:
@@ -65,6 +74,7 @@ class Config:
         """Initialize configuration from file and environment variables."""
         self.config_file = config_file
         self.config = self._load_config()
+        self._paths = self.config["paths"]
         self._create_directories()
 
     def _load_config(self) -> AppConfig:
@@ -73,25 +83,32 @@ class Config:
             raise FileNotFoundError(f"Config file not found: {self.config_file}")
 
         with open(self.config_file, "r") as f:
-            config_data = yaml.safe_load(f)
+            config_data = yaml.load(f, Loader=SafeLoader)
             return cast(AppConfig, config_data)
 
     def _create_directories(self) -> None:
         """Create necessary directories if they don't exist."""
-        for path_name in ["logs", "meetings", "screenshots"]:
-            path = self.get_path(cast(PathName, path_name))
+        # Also validates that every path is configured, so get_path can
+        # index directly afterwards
+        for path_name in PATH_NAMES:
+            path = self._paths.get(path_name)
+            if path is None:
+                raise KeyError(f"Path not found in config: {path_name}")
             os.makedirs(path, exist_ok=True)
 
     def get_path(self, name: PathName) -> str:
         """Get path from configuration."""
-        if name not in self.config["paths"]:
+        if name not in _PATH_NAME_SET:
             raise KeyError(f"Path not found in config: {name}")
-        return self.config["paths"][
-            name
-        ]  # Removed redundant cast since we know it's a str from PathsConfig
+        return self._paths[name]
 
     def get_azure_credentials(self) -> Dict[str, str]:
         """Get Azure credentials, with environment variables taking precedence."""
+        return self._azure_credentials
+
+    @cached_property
+    def _azure_credentials(self) -> Dict[str, str]:
+        """Azure credentials, resolved once from the environment and config."""
         return {
             "speech_key": os.getenv(
                 "AZURE_SPEECH_KEY", self.config["azure"]["speech_key"]
@@ -103,19 +120,29 @@ class Config:
 
     def get_transcription_settings(self) -> TranscriptionConfig:
         """Get transcription settings."""
-        return cast(TranscriptionConfig, self.config["transcription"])
+        return self.config["transcription"]
 
     def get_logging_settings(self) -> LoggingConfig:
         """Get logging settings."""
-        return cast(LoggingConfig, self.config["logging"])
+        return self.config["logging"]
 
     def get_user_settings(self) -> UserConfig:
         """Get user settings."""
-        return cast(
-            UserConfig,
-            self.config.get(
-                "user", {"default_participant": "", "create_default_meeting": False}
-            ),
+        return self.config.get(
+            "user", {"default_participant": "", "create_default_meeting": False}
+        )
+
+    def get_audio_settings(self) -> AudioConfig:
+        """Get audio capture settings."""
+        return self.config.get(
+            "audio",
+            {
+                "enabled": True,
+                "format": 1,  # pyaudio.paFloat32
+                "channels": 1,
+                "rate": 16000,
+                "chunk": 1600,  # 100 ms at 16 kHz, one chunk per meter refresh
+            },
         )
 
     def get_speech_config(self) -> Dict[str, str]:
@@ -125,6 +152,11 @@ class Config:
 
     def get_openai_settings(self) -> Dict[str, Any]:
         """Get OpenAI settings, with environment variables taking precedence."""
+        return self._openai_settings
+
+    @cached_property
+    def _openai_settings(self) -> Dict[str, Any]:
+        """OpenAI settings, resolved once from the environment and config."""
         return {
             "api_key": os.getenv("OPENAI_API_KEY", ""),
             "model": self.config["openai"]["model"],
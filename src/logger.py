@@ -1,33 +1,94 @@
+import asyncio
 import logging
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from textual.widgets import Log
 
 
+class _WidgetReadyFilter(logging.Filter):
+    """Drop records until the handler has a widget to write to."""
+
+    def __init__(self, handler: "UILogHandler") -> None:
+        super().__init__()
+        self.handler = handler
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return self.handler.log_widget is not None
+
+
 class UILogHandler(logging.Handler):
-    """Custom logging handler that writes to the Textual UI Log widget."""
+    """Custom logging handler that writes to the Textual UI Log widget.
+
+    Entries are buffered and written to the widget in one batch per
+    flush_interval, so bursts of log records cause a single widget update.
+    """
+
+    flush_interval = 0.05
 
     def __init__(self) -> None:
         super().__init__()
         self.log_widget: Optional[Log] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._buffer: List[str] = []
+        self._flush_scheduled = False
+        # Records arrive in bursts within the same second, so the formatted
+        # timestamp is cached per second
+        self._last_sec = -1
+        self._last_time_str = ""
+        # Records logged before the UI is mounted are dropped before emit
+        self.addFilter(_WidgetReadyFilter(self))
 
     def set_log_widget(self, log_widget: Log) -> None:
         """Set the Log widget to write to."""
         self.log_widget = log_widget
+        try:
+            # Flushes are scheduled on the loop that owns the widget
+            self._loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._loop = None
 
     def emit(self, record: logging.LogRecord) -> None:
-        if self.log_widget is None:
-            return
-
-        formatted_time = datetime.fromtimestamp(record.created).strftime("%H:%M:%S")
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._last_sec = sec
+            self._last_time_str = time.strftime("%H:%M:%S", time.localtime(sec))
 
         # Simple format without any styling
-        log_entry = f"{formatted_time} {record.levelname}: {record.getMessage()}\n"
+        log_entry = f"{self._last_time_str} {record.levelname}: {record.getMessage()}\n"
+
+        self._buffer.append(log_entry)
+
+        # Without an event loop there is nothing to batch on, write directly
+        if self._loop is None:
+            self.flush()
+            return
 
-        # Write to the log widget
-        self.log_widget.write(log_entry)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            try:
+                # emit may run on another thread (e.g. speech SDK callbacks)
+                self._loop.call_soon_threadsafe(
+                    self._loop.call_later, self.flush_interval, self.flush
+                )
+            except RuntimeError:
+                # Event loop closed, drop the buffered entries
+                self._buffer.clear()
+                self._flush_scheduled = False
+
+    def flush(self) -> None:
+        """Write all buffered entries to the log widget."""
+        self.acquire()
+        try:
+            entries, self._buffer = self._buffer, []
+            self._flush_scheduled = False
+        finally:
+            self.release()
+
+        if entries and self.log_widget is not None:
+            self.log_widget.write("".join(entries))
 
 
 class AppLogger:
@@ -35,25 +96,30 @@ class AppLogger:
 
     _instance: Optional["AppLogger"] = None
 
+    logger: logging.Logger
+    ui_handler: UILogHandler
+    file_handler: Optional[logging.FileHandler]
+
     def __new__(cls) -> "AppLogger":
+        # Set up the singleton once here, so later AppLogger() calls only
+        # return the existing instance
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            instance = super().__new__(cls)
+            instance._setup()
+            cls._instance = instance
         return cls._instance
 
-    def __init__(self) -> None:
-        if not hasattr(self, "initialized"):
-            self.logger = logging.getLogger("transcriber")
-            self.ui_handler = UILogHandler()
-            self.file_handler: Optional[logging.FileHandler] = None
-            self.initialized = True
-
-            # Set up basic configuration
-            self.logger.setLevel(logging.INFO)
-
-            # Create formatter
-            formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-            self.ui_handler.setFormatter(logging.Formatter("%(message)s"))
-            self.logger.addHandler(self.ui_handler)
+    def _setup(self) -> None:
+        """Configure the application logger and UI handler."""
+        self.logger = logging.getLogger("transcriber")
+        self.ui_handler = UILogHandler()
+        self.file_handler = None
+
+        # Set up basic configuration
+        self.logger.setLevel(logging.INFO)
+
+        self.ui_handler.setFormatter(logging.Formatter("%(message)s"))
+        self.logger.addHandler(self.ui_handler)
 
     def setup_file_logging(self, log_dir: str, enabled: bool = False) -> None:
         """Set up file logging if enabled."""
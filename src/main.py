@@ -1,9 +1,11 @@
 import argparse
+import sys
 
 from dotenv import load_dotenv
 
 from src.config import Config
-from src.ui.app import TranscriberUI
+
+DEFAULT_CONFIG_FILE = "config.yaml"
 
 
 def validate_azure_credentials(config: Config) -> None:
@@ -28,6 +30,10 @@ def validate_openai_credentials(config: Config) -> None:
 
 
 def parse_arguments() -> argparse.Namespace:
+    # Plain invocations don't need the parser at all
+    if len(sys.argv) == 1:
+        return argparse.Namespace(output=None, config=DEFAULT_CONFIG_FILE)
+
     parser = argparse.ArgumentParser(
         description="Meeting transcription and protocol generation"
     )
@@ -39,12 +45,26 @@ def parse_arguments() -> argparse.Namespace:
     parser.add_argument(
         "--config",
         "-c",
-        default="config.yaml",
-        help="Path to config file (default: config.yaml)",
+        default=DEFAULT_CONFIG_FILE,
+        help=f"Path to config file (default: {DEFAULT_CONFIG_FILE})",
     )
     return parser.parse_args()
 
 
+def install_event_loop() -> None:
+    """Use uvloop (winloop on Windows) as the asyncio event loop if available."""
+    try:
+        if sys.platform == "win32":
+            import winloop as fast_loop
+        else:
+            import uvloop as fast_loop
+    except ImportError:
+        # Not installed, fall back to the default loop
+        return
+
+    fast_loop.install()
+
+
 def main() -> int:
     # Load environment variables
     load_dotenv()
@@ -63,10 +83,18 @@ def main() -> int:
         # Get user settings
         user_settings = config.get_user_settings()
 
+        # Swap in the faster event loop before the UI starts its own
+        install_event_loop()
+
+        # Imported here so --help and configuration errors don't pay for
+        # loading textual, the speech SDK and openai
+        from src.ui.app import TranscriberUI
+
         # Create and run the UI with default participant
         app = TranscriberUI(
             default_participant=user_settings["default_participant"],
             create_sample=user_settings["create_default_meeting"],
+            config=config,
         )
 
         app.run()
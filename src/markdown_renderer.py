@@ -1,43 +1,131 @@
-from src.meeting_note import MeetingNote
+import io
+from typing import Any, Optional, TextIO, Tuple
+
+from src.meeting_note import MeetingNote, safe_title
+
+# Everything up to the transcript, filled in with a single str.format call.
+# The transcript is written separately so it can be streamed.
+_HEADER_TEMPLATE = (
+    "# {title}\n"
+    "📅 {date} · ⏱️ {duration}\n"
+    "\n"
+    "## 🏷️ Tags\n"
+    "{tags}\n"
+    "\n"
+    "## 👥 Attendees\n"
+    "{attendees}\n"
+    "\n"
+    "{summary}\n"
+    "\n"
+    "## 📜 Transcript\n"
+    "\n"
+)
+_NO_TAGS = "*No tags*"
+_NO_SUMMARY = "*No summary available*"
+_NO_TRANSCRIPT = "*No transcript available*"
+_EARLIER_LINES = "*Earlier transcript lines are not shown*\n\n"
+
+
+def _render_key(meeting: MeetingNote, tail: Optional[int]) -> Tuple[Any, ...]:
+    """Fingerprint of the fields that end up in the rendered markdown.
+
+    Lines are only appended to the transcript, or it is replaced by a new
+    list, so its length stands in for it together with the identity of
+    the list, which is compared by _cached.
+    """
+    return (
+        meeting.title,
+        meeting.start_time,
+        meeting.end_time,
+        tuple(meeting.tags),
+        tuple(meeting.participants),
+        meeting.summary,
+        len(meeting.raw_lines),
+        tail,
+    )
+
+
+def _cached(meeting: MeetingNote, key: Tuple[Any, ...]) -> Optional[str]:
+    """The markdown last rendered for a meeting if it is still up to date."""
+    rendered = meeting.rendered
+    if rendered is None:
+        return None
+    lines, rendered_key, markdown = rendered
+    if lines is not meeting.raw_lines or rendered_key != key:
+        return None
+    return markdown
 
 
 class MarkdownRenderer:
     """Renders meeting notes in Markdown format."""
 
     @staticmethod
-    def render(meeting: MeetingNote) -> str:
-        """Convert a meeting note to Markdown format."""
+    def render(meeting: MeetingNote, tail: Optional[int] = None) -> str:
+        """Convert a meeting note to Markdown format.
+
+        With tail, only the last tail lines of the transcript are rendered,
+        keeping the cost of a render independent of the meeting length.
+        """
+        # Checked before the transcript is joined, which is the costly part
+        key = _render_key(meeting, tail)
+        cached = _cached(meeting, key)
+        if cached is not None:
+            return cached
+
+        if tail is None:
+            transcript = meeting.raw_text
+        else:
+            truncated, transcript = meeting.transcript_tail(tail)
+            if truncated:
+                transcript = _EARLIER_LINES + transcript
+
         try:
-            md_parts = [
-                f"# {meeting.title}",
-                f"📅 {meeting.start_time.strftime('%Y-%m-%d %H:%M')} · ⏱️ {meeting.duration or 'Ongoing'}",
-                "",
-                "## 🏷️ Tags",
-                f"{', '.join(meeting.tags) if meeting.tags else '*No tags*'}",
-                "",
-                "## 👥 Attendees",
-                f"{', '.join(meeting.participants)}",
-                "",
-                meeting.summary if meeting.summary else "*No summary available*",
-                "",
-                "## 📜 Transcript",
-                "",
-                meeting.raw_text if meeting.raw_text else "*No transcript available*",
-                "",
-            ]
-            return "\n".join(md_parts)
+            buf = io.StringIO()
+            MarkdownRenderer._write(meeting, transcript, buf)
+            markdown = buf.getvalue()
         except Exception as e:
             return f"Error rendering markdown: {str(e)}"
 
+        meeting.rendered = (meeting.raw_lines, key, markdown)
+        return markdown
+
+    @staticmethod
+    def render_to(meeting: MeetingNote, out: TextIO) -> None:
+        """Write a meeting note as Markdown to a text stream."""
+        MarkdownRenderer._write(meeting, meeting.raw_text, out)
+
+    @staticmethod
+    def render_header(meeting: MeetingNote) -> str:
+        """The markdown up to the transcript, written before its first line."""
+        return _HEADER_TEMPLATE.format(
+            title=meeting.title,
+            date=meeting.start_time.strftime("%Y-%m-%d %H:%M"),
+            duration=meeting.duration or "Ongoing",
+            tags=", ".join(meeting.tags) if meeting.tags else _NO_TAGS,
+            attendees=", ".join(meeting.participants),
+            summary=meeting.summary or _NO_SUMMARY,
+        )
+
+    @staticmethod
+    def _write(meeting: MeetingNote, transcript: str, out: TextIO) -> None:
+        """Write the header followed by the given transcript text."""
+        out.write(MarkdownRenderer.render_header(meeting))
+        out.write(transcript or _NO_TRANSCRIPT)
+        out.write("\n")
+
     @staticmethod
     def save_markdown(meeting: MeetingNote, directory: str = "meetings") -> None:
         """Save the meeting note as a Markdown file."""
         if not meeting.file_path:
             timestamp = meeting.start_time.strftime("%Y%m%d_%H%M%S")
-            safe_title = "".join(c if c.isalnum() else "_" for c in meeting.title)
-            md_path = f"{directory}/{timestamp}_{safe_title}.md"
+            md_path = f"{directory}/{timestamp}_{safe_title(meeting.title)}.md"
         else:
             md_path = meeting.file_path.replace(".json", ".md")
 
+        # Stream straight into the file unless the markdown is already cached
+        cached = _cached(meeting, _render_key(meeting, None))
         with open(md_path, "w", encoding="utf-8") as f:
-            f.write(MarkdownRenderer.render(meeting))
+            if cached is not None:
+                f.write(cached)
+            else:
+                MarkdownRenderer._write(meeting, meeting.raw_text, f)
@@ -1,8 +1,72 @@
 import json
 import os
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Union, Any
+from pathlib import Path
+from typing import Callable, List, Optional, Dict, Tuple, Union, Any
+
+try:
+    # Rust-backed JSON, falls back to the standard library if unavailable
+    import orjson
+
+    def _dumps(obj: Any, indent: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+
+    _loads = orjson.loads
+except ImportError:
+
+    def _dumps(obj: Any, indent: bool = False) -> bytes:
+        return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode(
+            "utf-8"
+        )
+
+    _loads = json.loads  # type: ignore[assignment]
+
+
+class _TranslateTable(Dict[int, Optional[str]]):
+    """str.translate table that is filled in per character on first use.
+
+    Characters accepted by keep map to themselves, everything else to
+    replacement (None deletes the character).
+    """
+
+    def __init__(self, keep: Callable[[str], bool], replacement: Optional[str]):
+        super().__init__()
+        self.keep = keep
+        self.replacement = replacement
+
+    def __missing__(self, code: int) -> Optional[str]:
+        char = chr(code)
+        value = char if self.keep(char) else self.replacement
+        self[code] = value
+        return value
+
+
+_SAFE_TITLE_TABLE = _TranslateTable(str.isalnum, "_")
+_FILE_TITLE_TABLE = _TranslateTable(lambda c: c.isalnum() or c in " _", None)
+
+
+def safe_title(title: str) -> str:
+    """Title with every non-alphanumeric character replaced by '_'."""
+    return title.translate(_SAFE_TITLE_TABLE)
+
+
+class _RawText:
+    """MeetingNote.raw_text, the transcript lines as newline separated text.
+
+    Reading joins the lines without changing them, so worker threads can
+    read while lines are appended.
+    """
+
+    def __get__(self, note: Optional["MeetingNote"], owner: Any = None) -> str:
+        if note is None:
+            # Default of the dataclass field
+            return ""
+        return "\n".join(note.raw_lines)
+
+    def __set__(self, note: "MeetingNote", value: str) -> None:
+        note.raw_lines = [value] if value else []
 
 
 @dataclass
@@ -15,10 +79,59 @@ class MeetingNote:
     participants: List[str] = field(default_factory=list)
     tags: List[str] = field(default_factory=list)
     content: List[str] = field(default_factory=list)
-    raw_text: str = ""
+    # Transcript lines, set before raw_text in __init__ and joined when
+    # raw_text is read, so appending a line doesn't copy the whole transcript
+    raw_lines: List[str] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    raw_text: _RawText = _RawText()
     summary: str = ""
     file_path: Optional[str] = None
     metadata: Dict[str, Union[str, int, float]] = field(default_factory=dict)
+    # Sequence number of the last transcript delta applied. Snapshots store
+    # it, so loading skips logged deltas the snapshot already contains.
+    delta_seq: int = field(default=0, init=False, repr=False, compare=False)
+    # Held while a delta is applied and while a snapshot copies the note,
+    # snapshots may be taken on a worker thread
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+    # Markdown last rendered by MarkdownRenderer, with the transcript lines
+    # and the other fields it was rendered from
+    rendered: Optional[Tuple[List[str], Tuple[Any, ...], str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Running word count over _counted_list[:_counted_items]. content is
+    # appended to or replaced, its items aren't edited in place.
+    _word_count: int = field(default=0, init=False, repr=False, compare=False)
+    _counted_items: int = field(default=0, init=False, repr=False, compare=False)
+    _counted_list: Optional[List[str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def compact_lines(self) -> None:
+        """Join the transcript lines into one, so later reads join fewer.
+
+        Only call this from the thread that appends lines.
+        """
+        if len(self.raw_lines) > 1:
+            self.raw_lines = ["\n".join(self.raw_lines)]
+
+    def transcript_tail(self, lines: int) -> Tuple[bool, str]:
+        """The last lines of the transcript, and whether earlier ones exist.
+
+        Reads raw_lines from the end, so the whole transcript isn't joined.
+        """
+        tail: List[str] = []
+        for chunk in reversed(self.raw_lines):
+            wanted = lines - len(tail)
+            parts = chunk.rsplit("\n", wanted)
+            if len(parts) > wanted:
+                # This chunk holds more lines than still fit
+                tail[:0] = parts[1:]
+                return True, "\n".join(tail)
+            tail[:0] = parts
+        return False, "\n".join(tail)
 
     @property
     def duration(self) -> Optional[timedelta]:
@@ -30,7 +143,49 @@ class MeetingNote:
     @property
     def word_count(self) -> int:
         """Get the total word count of the meeting content."""
-        return sum(len(text.split()) for text in self.content)
+        if self._counted_list is not self.content or self._counted_items > len(
+            self.content
+        ):
+            # Content was replaced or shrunk, count from the start
+            self._counted_list = self.content
+            self._word_count = 0
+            self._counted_items = 0
+        for text in self.content[self._counted_items :]:
+            self._word_count += len(text.split())
+        self._counted_items = len(self.content)
+        return self._word_count
+
+    @property
+    def delta_path(self) -> Optional[str]:
+        """Path of the append-only transcript log next to the JSON snapshot."""
+        return f"{self.file_path}.log" if self.file_path else None
+
+    def apply_delta(self, event: Dict[str, Any]) -> None:
+        """Apply a transcript delta event to the in-memory note."""
+        text = event["text"]
+        with self._lock:
+            if self.raw_lines:
+                self.raw_lines.append(text)
+            elif text:
+                self.raw_lines = [text]
+            if event.get("sentence"):
+                self.content.append(text)
+            self.delta_seq = event.get("seq", self.delta_seq + 1)
+
+    def append_delta(self, event: Dict[str, Any], directory: str = "meetings") -> None:
+        """Apply a delta event and append it to the transcript log.
+
+        Only the new line is written. A meeting that has no file yet gets a
+        full snapshot instead.
+        """
+        event = {**event, "seq": self.delta_seq + 1}
+        self.apply_delta(event)
+        if self.delta_path is None:
+            self.save(directory)
+            return
+
+        with open(self.delta_path, "ab") as f:
+            f.write(_dumps(event) + b"\n")
 
     def add_content(self, text: str) -> None:
         """Add new content to the meeting note."""
@@ -53,23 +208,27 @@ class MeetingNote:
             self.end_time = datetime.now()
 
         # Calculate metadata
+        self.metadata["date"] = self.start_time.strftime("%Y-%m-%d")
         self.metadata["duration"] = str(self.duration)
         self.metadata["word_count"] = self.word_count
         self.metadata["average_words_per_minute"] = self._calculate_words_per_minute()
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert the meeting note to a dictionary."""
-        return {
-            "title": self.title,
-            "start_time": self.start_time.isoformat(),
-            "end_time": self.end_time.isoformat() if self.end_time else None,
-            "participants": self.participants,
-            "tags": self.tags,
-            "content": self.content,
-            "raw_text": self.raw_text,
-            "summary": self.summary,
-            "metadata": self.metadata,
-        }
+        with self._lock:
+            # Copy the transcript, deltas applied later aren't in delta_seq
+            return {
+                "title": self.title,
+                "start_time": self.start_time.isoformat(),
+                "end_time": self.end_time.isoformat() if self.end_time else None,
+                "participants": self.participants,
+                "tags": self.tags,
+                "content": list(self.content),
+                "raw_text": self.raw_text,
+                "summary": self.summary,
+                "metadata": self.metadata,
+                "delta_seq": self.delta_seq,
+            }
 
     def get_summary(self) -> str:
         """Get a summary of the meeting."""
@@ -83,27 +242,49 @@ class MeetingNote:
         ]
         return "\n".join(summary)
 
-    def save(self, directory: str = "meetings") -> None:
-        """Save the meeting note to a file."""
+    def save(self, directory: str = "meetings", sync: bool = True) -> None:
+        """Save the meeting note to a file.
+
+        sync flushes the snapshot to disk before it replaces the previous
+        one, periodic snapshots taken while recording skip it.
+        """
         os.makedirs(directory, exist_ok=True)
 
         # Generate filename if not set
         if not self.file_path:
             timestamp = self.start_time.strftime("%Y%m%d_%H%M%S")
-            safe_title = "".join(c if c.isalnum() else "_" for c in self.title)
-            self.file_path = os.path.join(directory, f"{timestamp}_{safe_title}.json")
+            self.file_path = os.path.join(
+                directory, f"{timestamp}_{safe_title(self.title)}.json"
+            )
+
+        # Deltas logged from here on go to a new log. The rotated one is
+        # removed once the snapshot is in place, deltas found in both the
+        # snapshot and a log are skipped on load by their sequence number.
+        # A rotated log left by an interrupted save is kept until then.
+        delta_path = f"{self.file_path}.log"
+        rotated_path = f"{delta_path}.old"
+        if os.path.exists(delta_path) and not os.path.exists(rotated_path):
+            os.replace(delta_path, rotated_path)
 
-        # Save as JSON
-        with open(self.file_path, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        # Save as JSON next to the snapshot and swap it in, so a crash while
+        # writing leaves the previous snapshot and the logs in place
+        temp_path = f"{self.file_path}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(_dumps(self.to_dict(), indent=True))
+            if sync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temp_path, self.file_path)
+
+        if os.path.exists(rotated_path):
+            os.remove(rotated_path)
 
     @classmethod
     def load(cls, file_path: str) -> "MeetingNote":
         """Load a meeting note from a file."""
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _loads(Path(file_path).read_bytes())
 
-        return cls(
+        meeting = cls(
             title=data["title"],
             start_time=datetime.fromisoformat(data["start_time"]),
             end_time=datetime.fromisoformat(data["end_time"])
@@ -117,12 +298,47 @@ class MeetingNote:
             file_path=file_path,
             metadata=data.get("metadata", {}),
         )
+        meeting.delta_seq = data.get("delta_seq", 0)
+
+        # Replay transcript lines appended since the last snapshot, from a
+        # log rotated by an interrupted save first
+        delta_path = f"{file_path}.log"
+        for path in (f"{delta_path}.old", delta_path):
+            if not os.path.exists(path):
+                continue
+            with open(path, "rb") as f:
+                for line in f:
+                    try:
+                        event = _loads(line)
+                    except ValueError:
+                        # Torn final line from an interrupted write
+                        break
+                    if event.get("seq", meeting.delta_seq + 1) > meeting.delta_seq:
+                        meeting.apply_delta(event)
+
+        return meeting
+
+    def update_file_path(self, directory: Optional[str] = None) -> None:
+        """Update the file path based on current title.
+
+        The path is built under directory, by default the one the meeting is
+        stored in. A meeting saved under its old path is snapshotted to the
+        new one, which takes in its logged deltas, and the old snapshot and
+        log are removed.
+        """
+        old_path = self.file_path
+        old_delta_path = f"{old_path}.log"
+        if directory is None:
+            directory = os.path.dirname(old_path) if old_path else "meetings"
 
-    def update_file_path(self) -> None:
-        """Update the file path based on current title."""
         timestamp = self.start_time.strftime("%Y%m%d_%H%M%S")
-        safe_title = "".join(
-            c for c in self.title if c.isalnum() or c in (" ", "_")
-        ).rstrip()
-        safe_title = safe_title.replace(" ", "_")
-        self.file_path = f"{timestamp}_{safe_title}.json"
+        title = self.title.translate(_FILE_TITLE_TABLE).rstrip()
+        title = title.replace(" ", "_")
+        self.file_path = os.path.join(directory, f"{timestamp}_{title}.json")
+        if old_path is None or self.file_path == old_path:
+            return
+
+        self.save(directory)
+        for path in (old_path, old_delta_path, f"{old_delta_path}.old"):
+            if os.path.exists(path):
+                os.remove(path)
@@ -1,14 +1,49 @@
+import asyncio
 import logging
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 from src.meeting_note import MeetingNote
 
+# Lines ending in one of these are also added to the structured content
+SENTENCE_ENDINGS = frozenset(".!?")
+
+# Transcript used for the sample meeting, built once at import
+SAMPLE_CONTENT = (
+    "Alice: Good morning everyone! Let's go through our updates.",
+    "Bob: I've completed the authentication module yesterday. All tests are passing.",
+    "Charlie: Great work Bob! I'm still working on the database optimization task.",
+    "Alice: Any blockers we should discuss?",
+    "Bob: Actually yes, I need some clarification on the new API requirements.",
+    "Charlie: I can help with that. Let's schedule a quick call after this.",
+    "Alice: Perfect. I'll update the sprint board with our progress.",
+    "Bob: Also, don't forget we have the client demo tomorrow at 2 PM.",
+    "Charlie: I'll prepare the presentation slides today.",
+    "Alice: Excellent! Let's wrap up then. Great progress everyone!",
+)
+SAMPLE_RAW_TEXT = "\n".join(SAMPLE_CONTENT)
+
+
+def _trigrams(word: str) -> Set[str]:
+    """The three character substrings of a word, none if it is shorter."""
+    return {word[i : i + 3] for i in range(len(word) - 2)}
+
 
 class MeetingStore:
     """Manages storage and retrieval of meeting notes."""
 
+    # Transcript lines are appended to a delta log; a full JSON snapshot is
+    # written every snapshot_every lines and when the meeting ends
+    snapshot_every = 50
+    # Upper bound on threads used to read meeting files in list_meetings
+    max_load_workers = 32
+    # Meetings kept in memory by load_meeting and list_meetings
+    max_cached_meetings = 128
+
     def __init__(
         self,
         storage_dir: str = "meetings",
@@ -18,34 +53,30 @@ class MeetingStore:
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(exist_ok=True)
         self.current_meeting: Optional[MeetingNote] = None
-        self.cached_meetings: Dict[str, MeetingNote] = {}
+        # Least recently used first, with the file mtime each entry was read at
+        self.cached_meetings: OrderedDict[str, MeetingNote] = OrderedDict()
+        self._cached_mtimes: Dict[str, int] = {}
+        # Inverted index over the searchable fields: trigram of a lowercased
+        # word -> file paths of the meetings containing it, plus the
+        # trigrams per path and the file mtime each path was indexed at
+        self._index: Dict[str, Set[str]] = {}
+        self._indexed_grams: Dict[str, Set[str]] = {}
+        self._indexed_mtimes: Dict[str, int] = {}
         self.logger = logging.getLogger(__name__)
         self.default_participant = default_participant
+        self._deltas_since_snapshot = 0
 
         if create_sample:
             self._create_sample_meeting()
 
     def _create_sample_meeting(self) -> None:
         """Create a sample meeting with test content."""
-        sample_content = [
-            "Alice: Good morning everyone! Let's go through our updates.",
-            "Bob: I've completed the authentication module yesterday. All tests are passing.",
-            "Charlie: Great work Bob! I'm still working on the database optimization task.",
-            "Alice: Any blockers we should discuss?",
-            "Bob: Actually yes, I need some clarification on the new API requirements.",
-            "Charlie: I can help with that. Let's schedule a quick call after this.",
-            "Alice: Perfect. I'll update the sprint board with our progress.",
-            "Bob: Also, don't forget we have the client demo tomorrow at 2 PM.",
-            "Charlie: I'll prepare the presentation slides today.",
-            "Alice: Excellent! Let's wrap up then. Great progress everyone!",
-        ]
-
         meeting = MeetingNote(
             title="Team Standup",
             participants=["Alice", "Bob", "Charlie"],
             tags=["standup", "development"],
-            content=sample_content,
-            raw_text="\n".join(sample_content),
+            content=list(SAMPLE_CONTENT),
+            raw_text=SAMPLE_RAW_TEXT,
             start_time=datetime.now() - timedelta(minutes=30),
         )
 
@@ -75,13 +106,12 @@ class MeetingStore:
             tags=tags or [],  # Ensure tags is a list
             start_time=datetime.now(),
             content=content or [],  # Initialize content list
-            raw_text=""
-            if content is None
-            else "\n".join(content),  # Initialize raw_text
+            raw_text="\n".join(content or []),  # Initialize raw_text
         )
 
         # Set as current meeting
         self.current_meeting = meeting
+        self._deltas_since_snapshot = 0
         return meeting
 
     def add_content(self, text: str) -> None:
@@ -95,26 +125,39 @@ class MeetingStore:
             if not text_stripped:
                 return
 
-            self.logger.debug(f"Adding content to meeting: {text_stripped}")
+            # Called for every transcribed line
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Adding content to meeting: {text_stripped}")
 
-            # Add to raw text
-            if not self.current_meeting.raw_text:
-                self.current_meeting.raw_text = text_stripped
-            else:
-                self.current_meeting.raw_text += f"\n{text_stripped}"
+            # Add to raw text, and to structured content if it ends with
+            # punctuation
+            event = {
+                "text": text_stripped,
+                "sentence": text_stripped[-1] in SENTENCE_ENDINGS,
+            }
 
-            # Add to structured content if it ends with punctuation
-            if text_stripped.endswith((".", "!", "?")):
-                self.current_meeting.content.append(text_stripped)
-                self.logger.debug(f"Added complete sentence: {text_stripped}")
+            # Persist only the new line, with a periodic full snapshot
+            self._deltas_since_snapshot += 1
+            if self._deltas_since_snapshot >= self.snapshot_every:
+                self.current_meeting.apply_delta(event)
+                # Lines are appended on this thread, join them while saving
+                self.current_meeting.compact_lines()
+                self.current_meeting.save(str(self.storage_dir), sync=False)
+                self._deltas_since_snapshot = 0
+            else:
+                self.current_meeting.append_delta(event, str(self.storage_dir))
 
-            # Save to disk
-            self.current_meeting.save()
+            if self.current_meeting.file_path not in self._indexed_grams:
+                self._index_meeting(self.current_meeting)
+            elif event["sentence"]:
+                self._add_to_index(self.current_meeting.file_path, [text_stripped])
 
-            self.logger.debug(
-                f"Meeting updated - Raw text: {len(self.current_meeting.raw_text)} chars, "
-                f"Content: {len(self.current_meeting.content)} items"
-            )
+            # raw_text joins the pending lines, only pay for it when logged
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    f"Meeting updated - Raw text: {len(self.current_meeting.raw_text)} chars, "
+                    f"Content: {len(self.current_meeting.content)} items"
+                )
         except Exception as e:
             self.logger.error(f"Error adding content: {e}", exc_info=True)
 
@@ -128,49 +171,249 @@ class MeetingStore:
     def save_meeting(self, meeting: MeetingNote) -> None:
         """Save a meeting to storage."""
         try:
-            meeting.save(str(self.storage_dir))
-            if meeting.file_path is not None:  # Add type check
-                self.cached_meetings[meeting.file_path] = meeting
-                self.logger.info(f"Saved meeting: {meeting.file_path}")
+            self._saved(meeting, self._write_meeting(meeting))
         except Exception as e:
             self.logger.error(f"Error saving meeting: {e}")
 
+    async def save_meeting_async(self, meeting: MeetingNote) -> None:
+        """Save a meeting from the event loop, writing it in a worker thread."""
+        try:
+            self._saved(meeting, await asyncio.to_thread(self._write_meeting, meeting))
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.error(f"Error saving meeting: {e}")
+
+    def _write_meeting(self, meeting: MeetingNote) -> Optional[int]:
+        """Write a meeting file and return its mtime, leaving the cache alone."""
+        meeting.save(str(self.storage_dir))
+        if meeting.file_path is None:
+            return None
+        return os.stat(meeting.file_path).st_mtime_ns
+
+    def _saved(self, meeting: MeetingNote, mtime: Optional[int]) -> None:
+        """Cache and index a meeting just written with the given mtime."""
+        if meeting is self.current_meeting:
+            self._deltas_since_snapshot = 0
+        if meeting.file_path is not None and mtime is not None:
+            self._cache(meeting.file_path, meeting, mtime)
+            self._index_meeting(meeting, mtime)
+            self.logger.info(f"Saved meeting: {meeting.file_path}")
+
     def load_meeting(self, file_path: str) -> Optional[MeetingNote]:
         """Load a meeting from storage."""
-        if file_path in self.cached_meetings:
-            return self.cached_meetings[file_path]
+        cached = self._cached(file_path)
+        if cached is not None:
+            return cached
+
+        loaded = self._read_meeting(file_path)
+        if loaded is None:
+            return None
+        meeting, mtime = loaded
+        self._remember(file_path, meeting, mtime)
+        return meeting
+
+    def _cached(
+        self, file_path: str, mtime: Optional[int] = None
+    ) -> Optional[MeetingNote]:
+        """Return the cached meeting if the file hasn't changed since.
+
+        mtime can be passed in when the caller already has it from a stat.
+        """
+        meeting = self.cached_meetings.get(file_path)
+        if meeting is None:
+            return None
 
+        # The current meeting is the source of truth for its own file
+        if meeting is not self.current_meeting:
+            if mtime is None:
+                try:
+                    mtime = os.stat(file_path).st_mtime_ns
+                except OSError:
+                    pass
+            if mtime != self._cached_mtimes.get(file_path):
+                del self.cached_meetings[file_path]
+                del self._cached_mtimes[file_path]
+                return None
+
+        self.cached_meetings.move_to_end(file_path)
+        return meeting
+
+    def _cache(self, file_path: str, meeting: MeetingNote, mtime: int) -> None:
+        """Add a meeting to the cache, evicting the least recently used."""
+        self.cached_meetings[file_path] = meeting
+        self.cached_meetings.move_to_end(file_path)
+        self._cached_mtimes[file_path] = mtime
+        while len(self.cached_meetings) > self.max_cached_meetings:
+            evicted, _ = self.cached_meetings.popitem(last=False)
+            del self._cached_mtimes[evicted]
+
+    def _read_meeting(self, file_path: str) -> Optional[Tuple[MeetingNote, int]]:
+        """Read a meeting file and its mtime, safe to call from worker threads."""
         try:
-            meeting = MeetingNote.load(file_path)
-            self.cached_meetings[file_path] = meeting
-            return meeting
+            # Stat first, so a write racing the read makes the entry stale
+            mtime = os.stat(file_path).st_mtime_ns
+            return MeetingNote.load(file_path), mtime
         except Exception as e:
             self.logger.error(f"Error loading meeting: {e}")
             return None
 
-    def list_meetings(self) -> List[MeetingNote]:
-        """List all available meetings."""
+    def _remember(self, file_path: str, meeting: MeetingNote, mtime: int) -> None:
+        """Cache and index a meeting read from storage."""
+        self._cache(file_path, meeting, mtime)
+        self._index_meeting(meeting, mtime)
+
+    def _json_files(self) -> Dict[str, int]:
+        """Map the meeting files in storage to their mtimes."""
+        # scandir hands out the entries with their type, one stat per file
+        # is left for the cache check
+        with os.scandir(self.storage_dir) as it:
+            return {
+                entry.path: entry.stat().st_mtime_ns
+                for entry in it
+                if entry.name.endswith(".json") and entry.is_file()
+            }
+
+    def _read_files(self, paths: List[str]) -> Dict[str, Tuple[MeetingNote, int]]:
+        """Read meeting files and their mtimes, leaving the cache alone."""
+        # Files not seen yet are read in parallel, the reads are I/O bound
+        # and release the GIL
+        if len(paths) > 1:
+            workers = min(self.max_load_workers, len(paths))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                loaded = list(executor.map(self._read_meeting, paths))
+        else:
+            loaded = [self._read_meeting(path) for path in paths]
+        return {path: result for path, result in zip(paths, loaded) if result}
+
+    def _read_meetings(self, paths: List[str]) -> List[MeetingNote]:
+        """Read, cache and index meeting files that aren't cached."""
+        meetings = []
+        for path, (meeting, mtime) in self._read_files(paths).items():
+            self._remember(path, meeting, mtime)
+            meetings.append(meeting)
+        return meetings
+
+    def _split_cached(
+        self, files: Dict[str, int]
+    ) -> Tuple[List[MeetingNote], List[str]]:
+        """Split meeting files into cached meetings and paths still to read."""
         meetings = []
-        for file_path in self.storage_dir.glob("*.json"):
-            if meeting := self.load_meeting(str(file_path)):
+        missing = []
+        for path, mtime in files.items():
+            if meeting := self._cached(path, mtime):
                 meetings.append(meeting)
+            else:
+                missing.append(path)
+        return meetings, missing
+
+    def list_meetings(self) -> List[MeetingNote]:
+        """List all available meetings."""
+        meetings, missing = self._split_cached(self._json_files())
+        meetings.extend(self._read_meetings(missing))
+        return sorted(meetings, key=lambda m: m.start_time, reverse=True)
+
+    async def load_meetings(
+        self, file_paths: Optional[Iterable[str]] = None
+    ) -> List[MeetingNote]:
+        """Load stored meetings, all of them by default, from the event loop.
+
+        Only the file reads run in worker threads. The cache and index are
+        updated on the loop, where add_content changes them as well.
+        """
+        files = await asyncio.to_thread(self._json_files)
+        if file_paths is not None:
+            files = {path: files[path] for path in file_paths if path in files}
+
+        meetings, missing = self._split_cached(files)
+        loaded = await asyncio.to_thread(self._read_files, missing)
+        for path, (meeting, mtime) in loaded.items():
+            self._remember(path, meeting, mtime)
+            meetings.append(meeting)
         return sorted(meetings, key=lambda m: m.start_time, reverse=True)
 
     def search_meetings(self, query: str) -> List[MeetingNote]:
         """Search meetings by title, participants, or tags."""
         query = query.lower()
-        results = []
+        self._refresh_index()
+
+        # A substring match lies within one word of the searched text per
+        # query word, so every trigram of a query word is in the index for
+        # a matching meeting. The postings narrow the candidates and the
+        # full check below keeps the results exact. Shorter query words
+        # don't narrow them.
+        candidates: Optional[Set[str]] = None
+        for query_word in query.split():
+            for gram in _trigrams(query_word):
+                paths = self._index.get(gram, set())
+                candidates = set(paths) if candidates is None else candidates & paths
+                if not candidates:
+                    return []
+        if candidates is None:
+            candidates = set(self._indexed_grams)
+
+        meetings = [
+            meeting
+            for path in candidates
+            if (meeting := self.load_meeting(path)) is not None
+            and self._matches(meeting, query)
+        ]
+        return sorted(meetings, key=lambda m: m.start_time, reverse=True)
+
+    def _refresh_index(self) -> None:
+        """Index the meeting files added or changed since they were indexed.
+
+        The current meeting is indexed as lines are added, so its file is
+        left alone.
+        """
+        files = self._json_files()
+        current = self.current_meeting.file_path if self.current_meeting else None
+        for path in [p for p in self._indexed_grams if p not in files]:
+            if path != current:
+                self._forget(path)
+        self._read_meetings(
+            [
+                path
+                for path, mtime in files.items()
+                if path != current and self._indexed_mtimes.get(path) != mtime
+            ]
+        )
+
+    @staticmethod
+    def _matches(meeting: MeetingNote, query: str) -> bool:
+        """Check whether a lowercased query occurs in a meeting."""
+        return (
+            query in meeting.title.lower()
+            or any(query in p.lower() for p in meeting.participants)
+            or any(query in t.lower() for t in meeting.tags)
+            or any(query in c.lower() for c in meeting.content)
+        )
 
-        for meeting in self.list_meetings():
-            if (
-                query in meeting.title.lower()
-                or any(query in p.lower() for p in meeting.participants)
-                or any(query in t.lower() for t in meeting.tags)
-                or any(query in c.lower() for c in meeting.content)
-            ):
-                results.append(meeting)
+    def _index_meeting(self, meeting: MeetingNote, mtime: Optional[int] = None) -> None:
+        """(Re)build the search index entries of a saved meeting.
 
-        return results
+        mtime is the one of the file the meeting was read from or saved to.
+        """
+        path = meeting.file_path
+        if path is None:
+            return
+
+        self._forget_words(path)
+        self._indexed_grams[path] = set()
+        if mtime is not None:
+            self._indexed_mtimes[path] = mtime
+        self._add_to_index(
+            path,
+            [meeting.title, *meeting.participants, *meeting.tags, *meeting.content],
+        )
+
+    def _add_to_index(self, path: str, texts: Iterable[str]) -> None:
+        """Add the trigrams of the words in texts to the index entries of path."""
+        grams = self._indexed_grams.setdefault(path, set())
+        for text in texts:
+            for word in text.lower().split():
+                for gram in _trigrams(word):
+                    if gram not in grams:
+                        grams.add(gram)
+                        self._index.setdefault(gram, set()).add(path)
 
     def update_current_meeting(
         self,
@@ -186,10 +429,31 @@ class MeetingStore:
         self.logger.debug(f"Updating meeting: {self.current_meeting.title} -> {title}")
 
         # Update the meeting
-        self.current_meeting.title = title
-        self.current_meeting.participants = participants or []
-        self.current_meeting.tags = tags or []
+        meeting = self.current_meeting
+        old_path = meeting.file_path
+        meeting.title = title
+        meeting.participants = participants or []
+        meeting.tags = tags or []
 
-        # Save the changes
-        self.current_meeting.save()
+        # Move it to a file named after the new title, taking the logged
+        # deltas along, and save the changes
+        meeting.update_file_path(str(self.storage_dir))
+        if old_path is not None and old_path != meeting.file_path:
+            self._forget(old_path)
+        self.save_meeting(meeting)
         self.logger.debug("Meeting updated and saved")
+
+    def _forget(self, file_path: str) -> None:
+        """Drop a meeting file that no longer exists from the cache and index."""
+        self.cached_meetings.pop(file_path, None)
+        self._cached_mtimes.pop(file_path, None)
+        self._forget_words(file_path)
+
+    def _forget_words(self, path: str) -> None:
+        """Remove the search index entries of path."""
+        self._indexed_mtimes.pop(path, None)
+        for gram in self._indexed_grams.pop(path, ()):
+            gram_paths = self._index[gram]
+            gram_paths.discard(path)
+            if not gram_paths:
+                del self._index[gram]
@@ -1,41 +1,84 @@
+import os
+import time
 from datetime import datetime
-from typing import Optional, TextIO
+from typing import List, Optional
 
 from src.meeting_store import MeetingStore
 
 
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of data to fd, os.write may write only part of it."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
 class ProtocolWriter:
-    """Handles writing transcribed text to a protocol file."""
+    """Handles writing transcribed text to a protocol file.
+
+    Entries are encoded once, buffered and written to the file with a single
+    os.write every flush_every entries or when flush_interval seconds have
+    passed since the last flush, instead of after every entry.
+    """
+
+    flush_every = 32
+    flush_interval = 2.0
 
     def __init__(self, output_file: str, meeting_store: Optional[MeetingStore] = None):
         self.output_file = output_file
-        self.file_handle: Optional[TextIO] = None
         self.meeting_store = meeting_store
+        # Raw O_APPEND descriptor, bypassing the text layer of open()
+        self._fd: Optional[int] = None
+        self._pending: List[bytes] = []
+        self._last_flush = 0.0
 
     def start_protocol(self) -> None:
         """Starts a new protocol session."""
-        self.file_handle = open(self.output_file, "w", encoding="utf-8")
+        self._fd = os.open(
+            self.output_file,
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_APPEND,
+            0o644,
+        )
         header = f"Protocol - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
         header += "=" * 50 + "\n\n"
-        self.file_handle.write(header)
+        _write_all(self._fd, header.encode("utf-8"))
+        self._pending = []
+        self._last_flush = time.monotonic()
 
     def write_entry(self, text: str) -> None:
         """Writes a new entry to the protocol and meeting store."""
-        if self.file_handle:
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            entry = f"[{timestamp}] {text}\n"
-            self.file_handle.write(entry)
-            self.file_handle.flush()
+        if self._fd is not None:
+            # Formatted from the fields directly, strftime is slower per call
+            now = datetime.now()
+            entry = f"[{now.hour:02d}:{now.minute:02d}:{now.second:02d}] {text}\n"
+            self._pending.append(entry.encode("utf-8"))
+
+            if (
+                len(self._pending) >= self.flush_every
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            ):
+                self.flush()
 
-            # Also add to meeting store if available
+            # Also add to meeting store if available. It gets the bare text,
+            # the timestamp prefix only belongs in the protocol file.
             if self.meeting_store:
-                self.meeting_store.add_content(entry)
+                self.meeting_store.add_content(text)
+
+    def flush(self) -> None:
+        """Write buffered entries to disk."""
+        if self._fd is not None:
+            if self._pending:
+                data, self._pending = b"".join(self._pending), []
+                _write_all(self._fd, data)
+            self._last_flush = time.monotonic()
 
     def close_protocol(self) -> None:
         """Closes the protocol session."""
-        if self.file_handle:
+        if self._fd is not None:
+            self.flush()
             footer = (
                 f"\nProtocol ended - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
             )
-            self.file_handle.write(footer)
-            self.file_handle.close()
+            _write_all(self._fd, footer.encode("utf-8"))
+            os.close(self._fd)
+            self._fd = None
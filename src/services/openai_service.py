@@ -1,10 +1,25 @@
-from typing import Dict, Any, TypedDict, List
+import importlib.util
+import json
+from functools import lru_cache
+from typing import TYPE_CHECKING, AsyncGenerator, Dict, Any, TypedDict, List, Tuple
 
-# type: ignore[import]
-from openai.types.chat import ChatCompletionMessageParam
 from src.config import Config
 from src.logger import AppLogger
 
+if TYPE_CHECKING:
+    # Only needed for annotations, openai itself is imported on first use
+    from openai import AsyncOpenAI, Batch, ChatCompletionMessageParam
+
+
+@lru_cache(maxsize=128)
+def _format_prompt(
+    template: str, title: str, date: str, duration: str, participants: str
+) -> str:
+    """Fill in the system prompt, repeated summaries of a meeting reuse it."""
+    return template.format(
+        title=title, date=date, duration=duration, participants=participants
+    )
+
 
 class ChatMessage(TypedDict):
     role: str
@@ -20,10 +35,8 @@ class OpenAIService:
         self.logger.info("Initializing OpenAI service")
 
         try:
-            from openai import AsyncOpenAI
-
             settings = config.get_openai_settings()
-            self.client = AsyncOpenAI(api_key=settings["api_key"])
+            self.client = self._create_client(settings["api_key"])
             self.model = settings["model"]
             self.temperature = settings["temperature"]
             self.max_tokens = settings["max_tokens"]
@@ -39,68 +52,212 @@ class OpenAIService:
                 "OpenAI package not installed. Please install 'openai>=1.0.0'"
             )
 
-    async def generate_summary(self, meeting_data: Dict[str, Any]) -> str:
-        """Generate a meeting summary using OpenAI."""
-        self.logger.info("Starting meeting summary generation")
-        self.logger.debug(f"Raw meeting data: {meeting_data}")
+    @staticmethod
+    def _create_client(api_key: str) -> "AsyncOpenAI":
+        """Create a client whose requests share one pool of keep-alive connections."""
+        import httpx
+        from openai import AsyncOpenAI
 
-        try:
-            # Debug raw data
-            title = meeting_data.get("title", "Untitled Meeting")
-            participants = meeting_data.get("participants", [])
-            content = meeting_data.get("content", "")
-
-            self.logger.debug(f"Title: {title}")
-            self.logger.debug(f"Participants (raw): {participants}")
-            self.logger.debug(f"Content: {content[:200]}...")  # First 200 chars
-
-            # Fix participants joining
-            participants_str = (
-                ", ".join(participants)
-                if isinstance(participants, list)
-                else str(participants)
-            )
-            self.logger.debug(f"Participants (formatted): {participants_str}")
+        # HTTP/2 needs the h2 package, otherwise connections are still
+        # pooled and kept alive over HTTP/1.1
+        http_client = httpx.AsyncClient(
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+            timeout=httpx.Timeout(60.0, connect=5.0),
+        )
+        return AsyncOpenAI(api_key=api_key, http_client=http_client)
 
-            formatted_prompt = self.system_prompt.format(
-                title=title,
-                date=meeting_data.get("date", ""),
-                duration=meeting_data.get("duration", ""),
-                participants=participants_str,
-            )
+    async def close(self) -> None:
+        """Close the client and its pooled connections."""
+        self.logger.info("Closing OpenAI client")
+        await self.client.close()
+
+    def _build_messages(
+        self, meeting_data: Dict[str, Any]
+    ) -> List["ChatCompletionMessageParam"]:
+        """Build the chat messages asking for a summary of one meeting."""
+        system_prompt, content = self._message_contents(meeting_data)
+        messages: List["ChatCompletionMessageParam"] = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": content},
+        ]
+        return messages
 
-            self.logger.debug(f"Formatted system prompt: {formatted_prompt}")
+    def _message_contents(self, meeting_data: Dict[str, Any]) -> Tuple[str, str]:
+        """Get the system prompt and user content for a meeting summary."""
+        # Debug raw data
+        title = meeting_data.get("title", "Untitled Meeting")
+        participants = meeting_data.get("participants", [])
+        content = meeting_data.get("content", "")
 
-            messages: List[ChatCompletionMessageParam] = [
-                {"role": "system", "content": formatted_prompt},
-                {"role": "user", "content": content},
-            ]
+        self.logger.debug(f"Title: {title}")
+        self.logger.debug(f"Participants (raw): {participants}")
+        self.logger.debug(f"Content: {content[:200]}...")  # First 200 chars
+
+        # Fix participants joining
+        participants_str = (
+            ", ".join(participants)
+            if isinstance(participants, list)
+            else str(participants)
+        )
+        self.logger.debug(f"Participants (formatted): {participants_str}")
+
+        formatted_prompt = _format_prompt(
+            self.system_prompt,
+            title,
+            meeting_data.get("date", ""),
+            meeting_data.get("duration", ""),
+            participants_str,
+        )
+
+        self.logger.debug(f"Formatted system prompt: {formatted_prompt}")
+        return formatted_prompt, content
+
+    async def stream_summary(
+        self, meeting_data: Dict[str, Any]
+    ) -> AsyncGenerator[str, None]:
+        """Generate a meeting summary, yielding it in pieces as they arrive."""
+        self.logger.info("Starting meeting summary generation")
+        self.logger.debug(f"Raw meeting data: {meeting_data}")
+
+        try:
+            messages = self._build_messages(meeting_data)
 
             self.logger.debug(f"Final messages structure: {messages}")
 
             self.logger.info("Sending request to OpenAI API")
-            response = await self.client.chat.completions.create(
+            stream = await self.client.chat.completions.create(
                 model=self.model,
                 messages=messages,
                 temperature=self.temperature,
                 max_tokens=self.max_tokens,
+                stream=True,
             )
 
-            self.logger.debug(f"Raw OpenAI response: {response}")
-            self.logger.debug(f"Response choices: {response.choices}")
-
-            content = response.choices[0].message.content  # type: ignore[attr-defined]
-            self.logger.debug(f"Extracted content: {content}")
-
-            if content is None:
-                self.logger.error("Received empty response from OpenAI")
-                raise RuntimeError("Received empty response from OpenAI")
+            length = 0
+            async for chunk in stream:
+                # The final chunk may carry no choices
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    length += len(delta)
+                    yield delta
 
             self.logger.info("Successfully generated meeting summary")
-            self.logger.debug(f"Summary length: {len(str(content))} characters")
-            self.logger.debug(f"Final summary content: {content}")
-            return str(content)
+            self.logger.debug(f"Summary length: {length} characters")
 
         except Exception as e:
             self.logger.error(f"Error generating summary: {str(e)}", exc_info=True)
             raise RuntimeError(f"Error generating summary: {str(e)}")
+
+    async def generate_summary(self, meeting_data: Dict[str, Any]) -> str:
+        """Generate a meeting summary using OpenAI."""
+        content = "".join([delta async for delta in self.stream_summary(meeting_data)])
+        self.logger.debug(f"Final summary content: {content}")
+
+        if not content:
+            self.logger.error("Received empty response from OpenAI")
+            raise RuntimeError(
+                "Error generating summary: Received empty response from OpenAI"
+            )
+        return content
+
+    async def submit_summary_batch(self, meetings: Dict[str, Dict[str, Any]]) -> str:
+        """Submit summaries for several meetings as one Batch API job.
+
+        Batch jobs cost half as much as regular requests but may take up to
+        24 hours, so this is meant for summarizing stored meetings in bulk.
+        meetings maps a custom id to the meeting data taken by
+        generate_summary. Returns the batch id.
+        """
+        self.logger.info(f"Submitting summary batch for {len(meetings)} meetings")
+
+        # Each request is serialized right away, so one request template is
+        # filled in for every meeting instead of building new ones
+        system_message = {"role": "system", "content": ""}
+        user_message = {"role": "user", "content": ""}
+        request: Dict[str, Any] = {
+            "custom_id": "",
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": self.model,
+                "messages": [system_message, user_message],
+                "temperature": self.temperature,
+                "max_tokens": self.max_tokens,
+            },
+        }
+
+        lines = []
+        for custom_id, meeting_data in meetings.items():
+            request["custom_id"] = custom_id
+            system_message["content"], user_message["content"] = self._message_contents(
+                meeting_data
+            )
+            lines.append(json.dumps(request, ensure_ascii=False))
+        requests = "\n".join(lines)
+
+        from openai import OpenAIError
+
+        try:
+            batch_file = await self.client.files.create(
+                file=("summaries.jsonl", requests.encode("utf-8")), purpose="batch"
+            )
+            batch = await self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+        except OpenAIError as e:
+            self.logger.exception(f"Error submitting summary batch: {e}")
+            raise RuntimeError(f"Error submitting summary batch: {e}") from e
+
+        self.logger.info(f"Submitted summary batch {batch.id}")
+        return batch.id
+
+    async def poll_batch(self, batch_id: str) -> "Batch":
+        """Get the current state of a summary batch."""
+        from openai import OpenAIError
+
+        try:
+            batch = await self.client.batches.retrieve(batch_id)
+        except OpenAIError as e:
+            self.logger.exception(f"Error polling summary batch {batch_id}: {e}")
+            raise RuntimeError(f"Error polling summary batch: {e}") from e
+        self.logger.debug(f"Summary batch {batch_id} is {batch.status}")
+        return batch
+
+    async def retrieve_batch_results(self, file_id: str) -> Dict[str, str]:
+        """Read the summaries of a completed batch, keyed by custom id."""
+        from openai import OpenAIError
+
+        try:
+            output = await self.client.files.content(file_id)
+        except OpenAIError as e:
+            self.logger.exception(f"Error retrieving batch output {file_id}: {e}")
+            raise RuntimeError(f"Error retrieving batch output: {e}") from e
+
+        summaries: Dict[str, str] = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            try:
+                result = json.loads(line)
+                custom_id = result["custom_id"]
+                response = result.get("response") or {}
+                if response.get("status_code") != 200:
+                    self.logger.error(
+                        f"Summary for {custom_id} failed: "
+                        f"{result.get('error') or response}"
+                    )
+                    continue
+                content = response["body"]["choices"][0]["message"]["content"]
+            except (ValueError, KeyError, IndexError, TypeError) as e:
+                self.logger.error(f"Skipping malformed batch output line: {e}")
+                continue
+            if content:
+                summaries[custom_id] = content
+
+        self.logger.info(f"Retrieved {len(summaries)} summaries from batch output")
+        return summaries
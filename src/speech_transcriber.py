@@ -1,8 +1,8 @@
 import asyncio
+import logging
 import os
-import queue
-from queue import Queue
-from typing import Optional
+import threading
+from typing import Dict, List, Optional, Tuple
 
 import azure.cognitiveservices.speech as speechsdk
 from dotenv import load_dotenv
@@ -15,37 +15,67 @@ from src.state.app_state import TranscriptionLanguage
 class SpeechTranscriber:
     """Handles speech-to-text transcription using Azure Cognitive Services."""
 
+    # Seconds to wait for further utterances before queueing recognized text,
+    # so quick speech reaches the consumer as one entry instead of several
+    coalesce_window = 0.06
+    # Seconds between log lines counting the recognized utterances
+    stats_interval = 1.0
+
     def __init__(self, config: Optional[Config] = None):
         load_dotenv()
 
         self.config = config or Config()
         speech_config = self.config.get_speech_config()
 
-        self.speech_config = speechsdk.SpeechConfig(
-            subscription=speech_config.get("subscription")
-            or os.getenv("AZURE_SPEECH_KEY"),
-            region=speech_config.get("region") or os.getenv("AZURE_SPEECH_REGION"),
+        self._subscription = speech_config.get("subscription") or os.getenv(
+            "AZURE_SPEECH_KEY"
         )
+        self._region = speech_config.get("region") or os.getenv("AZURE_SPEECH_REGION")
         self.audio_config = speechsdk.audio.AudioConfig(use_default_microphone=True)
-        self.speech_recognizer = speechsdk.SpeechRecognizer(
-            speech_config=self.speech_config, audio_config=self.audio_config
+        # Recognizers are expensive to build, keep one per language so
+        # switching back and forth doesn't construct a new one every time
+        self._recognizers: Dict[
+            TranscriptionLanguage,
+            Tuple[speechsdk.SpeechConfig, speechsdk.SpeechRecognizer],
+        ] = {}
+        self.speech_config, self.speech_recognizer = self._recognizer_for(
+            TranscriptionLanguage.ENGLISH
         )
         self.logger = AppLogger().logger
         self.logger.info("Speech transcriber initialized")
 
         # Controls whether continuous recognition is active
         self._running = False
-        # Thread-safe queue for the Azure callback
-        self._thread_queue: Queue[str] = Queue()
-        # Asyncio queue for the consumer
+        # Asyncio queue for the consumer, filled from the Azure callback thread
+        # through the event loop
         self._async_queue: asyncio.Queue[str] = asyncio.Queue()
-        # Background task for queue transfer
-        self._transfer_task: Optional[asyncio.Task] = None
-
-        # Set initial language
-        self.speech_config.speech_recognition_language = (
-            TranscriptionLanguage.ENGLISH.value
-        )
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Utterances recognized within the current coalescing window, and
+        # whether a flush has been requested from the loop for them
+        self._pending: List[str] = []
+        self._pending_lock = threading.Lock()
+        self._flush_requested = False
+        # Flush timer on the loop, only touched from the loop
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # Utterances recognized since the last stats line, guarded by
+        # _pending_lock like the window above
+        self._recognized_count = 0
+        self._stats_task: Optional[asyncio.Task[None]] = None
+
+    def _recognizer_for(
+        self, language: TranscriptionLanguage
+    ) -> Tuple[speechsdk.SpeechConfig, speechsdk.SpeechRecognizer]:
+        """Get the config and recognizer for a language, building them once."""
+        if language not in self._recognizers:
+            speech_config = speechsdk.SpeechConfig(
+                subscription=self._subscription, region=self._region
+            )
+            speech_config.speech_recognition_language = language.value
+            recognizer = speechsdk.SpeechRecognizer(
+                speech_config=speech_config, audio_config=self.audio_config
+            )
+            self._recognizers[language] = (speech_config, recognizer)
+        return self._recognizers[language]
 
     def get_transcript_queue(self) -> asyncio.Queue[str]:
         """Expose the transcript queue to other components."""
@@ -57,19 +87,31 @@ class SpeechTranscriber:
             return  # Already running
 
         self._running = True
-        self._thread_queue = queue.Queue()  # Create fresh queues
-        self._async_queue = asyncio.Queue()
+        self._async_queue = asyncio.Queue()  # Create a fresh queue
+        self._loop = asyncio.get_running_loop()
+        self._stats_task = asyncio.create_task(self._log_stats())
 
         def handle_result(evt: speechsdk.SpeechRecognitionEventArgs) -> None:
             """Handle speech recognition results."""
             if evt.result.reason == speechsdk.ResultReason.RecognizedSpeech:
                 text = evt.result.text
-                self.logger.info(f"Speech recognized: {text}")
-                try:
-                    # Put text in thread-safe queue
-                    self._thread_queue.put(text)
-                except Exception as e:
-                    self.logger.error(f"Error queueing text: {e}", exc_info=True)
+                # Called for every utterance, _log_stats reports the totals
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"Speech recognized: {text}")
+                # Runs on the SDK thread, collect the text until the window
+                # closes and then hand it over to the loop in one go
+                with self._pending_lock:
+                    loop = self._loop
+                    if loop is None:
+                        self.logger.warning(
+                            f"Dropping text recognized after stop: {text}"
+                        )
+                        return
+                    self._recognized_count += 1
+                    self._pending.append(text)
+                    if not self._flush_requested:
+                        self._flush_requested = True
+                        loop.call_soon_threadsafe(self._start_flush_timer)
             elif evt.result.reason == speechsdk.ResultReason.NoMatch:
                 self.logger.warning(
                     f"No speech could be recognized: {evt.result.no_match_details}"
@@ -80,54 +122,70 @@ class SpeechTranscriber:
                 )
                 self._running = False
 
-        # Start the queue transfer task
-        loop = asyncio.get_event_loop()
-        self._transfer_task = loop.create_task(self._transfer_queues())
-
         self.speech_recognizer.recognized.connect(handle_result)
         self.speech_recognizer.start_continuous_recognition_async()
         self.logger.info("Started continuous recognition")
 
-    async def _transfer_queues(self) -> None:
-        """Transfer items from thread queue to async queue."""
-        while self._running:
-            try:
-                # Check thread queue with timeout
-                try:
-                    text = self._thread_queue.get_nowait()
-                    await self._async_queue.put(text)
-                except queue.Empty:
-                    await asyncio.sleep(0.1)  # Short sleep before next check
-                    continue
-            except Exception as e:
-                self.logger.error(
-                    f"Error transferring between queues: {e}", exc_info=True
+    async def _log_stats(self) -> None:
+        """Log the number of recognized utterances every stats_interval."""
+        while True:
+            await asyncio.sleep(self.stats_interval)
+            with self._pending_lock:
+                count, self._recognized_count = self._recognized_count, 0
+            if count:
+                self.logger.info(
+                    f"Recognized {count} utterances in the last "
+                    f"{self.stats_interval:g}s"
                 )
-                await asyncio.sleep(0.1)  # Sleep on error before retry
+
+    def _start_flush_timer(self) -> None:
+        """Flush the pending utterances once the coalescing window closes."""
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                self.coalesce_window, self._flush_pending
+            )
+
+    def _flush_pending(self) -> None:
+        """Queue the utterances collected in the coalescing window as one entry.
+
+        Runs on the loop.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        with self._pending_lock:
+            self._flush_requested = False
+            if not self._pending:
+                return
+            text = " ".join(self._pending)
+            self._pending.clear()
+        self._async_queue.put_nowait(text)
 
     async def stop_transcription(self) -> None:
-        """Stop continuous speech recognition."""
+        """Stop continuous speech recognition.
+
+        Also cleans up after a Canceled event, which already cleared
+        _running.
+        """
+        if self._stats_task is not None:
+            self._stats_task.cancel()
+            self._stats_task = None
+        # Don't lose text still waiting in the coalescing window, and drop
+        # text recognized from here on
+        self._flush_pending()
+        with self._pending_lock:
+            self._loop = None
+        # The recognizer is kept for reuse, drop this run's result handler so
+        # the next start doesn't connect a second one
+        self.speech_recognizer.recognized.disconnect_all()
         if not self._running:
             return
         self._running = False
         self.speech_recognizer.stop_continuous_recognition_async()
 
-        # Cancel the transfer task
-        if self._transfer_task:
-            self._transfer_task.cancel()
-            try:
-                await self._transfer_task
-            except asyncio.CancelledError:
-                pass
-
         self.logger.info("Stopped continuous recognition")
 
     def set_language(self, language: TranscriptionLanguage) -> None:
         """Update the speech recognition language."""
-        self.speech_config.speech_recognition_language = language.value
+        self.speech_config, self.speech_recognizer = self._recognizer_for(language)
         self.logger.info(f"Speech recognition language set to: {language.value}")
-
-        # Recreate speech recognizer with new config
-        self.speech_recognizer = speechsdk.SpeechRecognizer(
-            speech_config=self.speech_config, audio_config=self.audio_config
-        )
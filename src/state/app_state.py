@@ -1,4 +1,5 @@
 import asyncio
+import logging
 from dataclasses import dataclass
 from enum import Enum
 from typing import Optional, Any
@@ -40,18 +41,20 @@ class AppState:
         self._lock = asyncio.Lock()
         self.logger = AppLogger().logger
 
-    async def get_state(self) -> AppStateData:
-        """Get current state (thread-safe)."""
-        async with self._lock:
-            return self._state
+    def get_state(self) -> AppStateData:
+        """Get current state."""
+        # Reads need no lock, writers never await while holding it
+        return self._state
 
     async def update_state(self, **kwargs: Any) -> None:
         """Update state attributes (thread-safe)."""
         async with self._lock:
+            debug = self.logger.isEnabledFor(logging.DEBUG)
             for key, value in kwargs.items():
                 if hasattr(self._state, key):
                     setattr(self._state, key, value)
-                    self.logger.debug(f"State updated: {key} = {value}")
+                    if debug:
+                        self.logger.debug(f"State updated: {key} = {value}")
                 else:
                     self.logger.error(f"Invalid state attribute: {key}")
 
@@ -62,18 +65,20 @@ class AppState:
             ):
                 self._state.is_processing = False
 
-    async def can_toggle_language(self) -> bool:
+    def can_toggle_language(self) -> bool:
         """Check if language can be toggled."""
-        state = await self.get_state()
+        state = self._state
         # Only allow toggle when stopped AND not processing
-        return state.is_processing
+        return (
+            state.recording_state == RecordingState.STOPPED and not state.is_processing
+        )
 
     async def toggle_language(self) -> Optional[TranscriptionLanguage]:
         """Toggle language if possible."""
-        if not await self.can_toggle_language():
-            return None
-
         async with self._lock:
+            if not self.can_toggle_language():
+                return None
+
             current = self._state.language
             new_language = (
                 TranscriptionLanguage.GERMAN
@@ -84,9 +89,9 @@ class AppState:
             self.logger.info(f"Language switched to: {new_language.value}")
             return new_language
 
-    async def can_generate_summary(self) -> bool:
+    def can_generate_summary(self) -> bool:
         """Check if summary can be generated."""
-        state = await self.get_state()
+        state = self._state
         return (
             state.recording_state == RecordingState.STOPPED
             or state.recording_state == RecordingState.PAUSED
@@ -1,4 +1,14 @@
-from typing import Any, Dict, List, Optional
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Generic,
+    List,
+    Literal,
+    Optional,
+    TypeVar,
+    overload,
+)
 
 from typing_extensions import TypedDict
 
@@ -24,7 +34,35 @@ class ChatCompletion(TypedDict):
     usage: Dict[str, int]
     system_fingerprint: Optional[str]
 
+class ChoiceDelta:
+    content: Optional[str]
+
+class ChunkChoice:
+    index: int
+    delta: ChoiceDelta
+
+class ChatCompletionChunk:
+    id: str
+    choices: List[ChunkChoice]
+
+_T = TypeVar("_T")
+
+class AsyncStream(Generic[_T]):
+    def __aiter__(self) -> AsyncIterator[_T]: ...
+
 class ChatCompletions:
+    @overload
+    @staticmethod
+    async def create(
+        model: str,
+        messages: List[ChatCompletionMessageParam],
+        temperature: float = 1.0,
+        max_tokens: int = 2048,
+        *,
+        stream: Literal[True],
+        **kwargs: Any,
+    ) -> AsyncStream[ChatCompletionChunk]: ...
+    @overload
     @staticmethod
     async def create(
         model: str,
@@ -37,6 +75,37 @@ class ChatCompletions:
 class Chat:
     completions: ChatCompletions
 
+class FileObject:
+    id: str
+
+class FileContent:
+    text: str
+
+class AsyncFiles:
+    async def create(self, file: Any, purpose: str, **kwargs: Any) -> FileObject: ...
+    async def content(self, file_id: str) -> FileContent: ...
+
+class Batch:
+    id: str
+    status: str
+    output_file_id: Optional[str]
+    error_file_id: Optional[str]
+
+class AsyncBatches:
+    async def create(
+        self,
+        input_file_id: str,
+        endpoint: str,
+        completion_window: str,
+        **kwargs: Any,
+    ) -> Batch: ...
+    async def retrieve(self, batch_id: str) -> Batch: ...
+
+class OpenAIError(Exception): ...
+
 class AsyncOpenAI:
-    def __init__(self, api_key: str) -> None: ...
+    def __init__(self, api_key: str, http_client: Any = None) -> None: ...
     chat: Chat
+    files: AsyncFiles
+    batches: AsyncBatches
+    async def close(self) -> None: ...
@@ -1,16 +1,34 @@
+import asyncio
 import logging
-from typing import TYPE_CHECKING
+from contextlib import aclosing
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from src.meeting_note import MeetingNote
+from src.meeting_store import SENTENCE_ENDINGS
 
 if TYPE_CHECKING:
     from src.ui.app import TranscriberUI
 
+# Log levels in the order toggle_log_level cycles through them
+_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_NEXT_LOG_LEVEL: Dict[int, str] = {
+    logging.getLevelNamesMapping()[name]: _LOG_LEVELS[(i + 1) % len(_LOG_LEVELS)]
+    for i, name in enumerate(_LOG_LEVELS)
+}
+
 
 class ActionHandler:
     """Centralized handler for UI actions with logging."""
 
+    # Most streamed summary pieces between redraws of the meeting view, the
+    # view is also redrawn whenever a sentence or line is complete
+    summary_refresh_every = 20
+
     def __init__(self, app: "TranscriberUI") -> None:
         self.app = app
         self.logger: logging.Logger = app.logger.logger
+        # Batch API job summarizing stored meetings, see summarize_all
+        self.summary_batch_id: Optional[str] = None
 
     async def new_meeting(self) -> None:
         """Create a new meeting."""
@@ -63,49 +81,146 @@ class ActionHandler:
             return
 
         # Check if we can generate summary
-        if not await self.app.state.can_generate_summary():
+        if not self.app.state.can_generate_summary():
             self.app.notify(
                 "Cannot generate summary while recording or processing",
                 title="⚠️ Warning",
             )
             return
 
+        meeting: Optional[MeetingNote] = None
+        previous_summary = ""
         try:
             await self.app.state.toggle_summarizing(True)
             self.logger.info("Generating meeting summary")
 
             meeting = self.app.meeting_store.current_meeting
-            meeting_data = {
-                "title": meeting.title,
-                "date": meeting.start_time.strftime("%Y-%m-%d"),
-                "duration": str(meeting.duration) if meeting.duration else "Unknown",
-                "participants": ", ".join(meeting.participants),
-                "content": meeting.raw_text,
-            }
+            previous_summary = meeting.summary
+            meeting_data = self._meeting_data(meeting)
 
             self.logger.debug(f"Meeting data: {meeting_data}")
 
-            summary = await self.app.openai_service.generate_summary(meeting_data)
+            # Show the summary while it is being written, a sentence at a time
+            parts: List[str] = []
+            unshown = 0
+            async with aclosing(
+                self.app.openai_service.stream_summary(meeting_data)
+            ) as stream:
+                async for delta in stream:
+                    parts.append(delta)
+                    unshown += 1
+                    end = delta.rstrip(" ")
+                    if (
+                        end[-1:] in SENTENCE_ENDINGS
+                        or end.endswith("\n")
+                        or unshown >= self.summary_refresh_every
+                    ):
+                        meeting.summary = "".join(parts)
+                        self.app.schedule_render()
+                        unshown = 0
+
+            summary = "".join(parts)
             if summary:
                 meeting.summary = summary
-                meeting.save()
+                await asyncio.to_thread(meeting.save)
+                self.app.render_meeting()
                 self.app.notify("Summary generated successfully!", title="📝 Summary")
             else:
+                meeting.summary = previous_summary
                 self.app.notify("Failed to generate summary", title="❌ Error")
 
         except Exception as e:
             self.logger.error(f"Error generating summary: {e}")
+            if meeting is not None:
+                # Don't keep a partially streamed summary
+                meeting.summary = previous_summary
+                self.app.render_meeting()
             self.app.notify("Failed to generate summary", title="❌ Error")
         finally:
             await self.app.state.toggle_summarizing(False)
 
+    async def summarize_all(self) -> None:
+        """Summarize all stored meetings without a summary in one batch.
+
+        The first call submits a Batch API job, later calls check on it and
+        save the summaries once it has completed.
+        """
+        service = self.app.openai_service
+        store = self.app.meeting_store
+
+        try:
+            if self.summary_batch_id is None:
+                stored_meetings = await store.load_meetings()
+                meetings = {
+                    meeting.file_path: self._meeting_data(meeting)
+                    for meeting in stored_meetings
+                    if meeting.file_path and not meeting.summary
+                }
+                if not meetings:
+                    self.app.notify("All meetings are summarized", title="📝 Summary")
+                    return
+
+                self.summary_batch_id = await service.submit_summary_batch(meetings)
+                self.app.notify(
+                    f"Submitted {len(meetings)} meetings for summarization",
+                    title="📝 Summary",
+                )
+                return
+
+            batch = await service.poll_batch(self.summary_batch_id)
+            if batch.status in ("failed", "expired", "cancelled"):
+                self.logger.error(f"Summary batch {batch.id} {batch.status}")
+                self.summary_batch_id = None
+                self.app.notify(f"Summary batch {batch.status}", title="❌ Error")
+                return
+            if batch.status != "completed" or not batch.output_file_id:
+                self.app.notify(f"Summary batch is {batch.status}", title="📝 Summary")
+                return
+
+            summaries = await service.retrieve_batch_results(batch.output_file_id)
+            await self._save_summaries(summaries)
+            self.summary_batch_id = None
+            self.app.notify(f"Saved {len(summaries)} summaries", title="📝 Summary")
+
+        except (RuntimeError, OSError) as e:
+            self.logger.error(f"Error summarizing meetings: {e}")
+            self.app.notify("Failed to summarize meetings", title="❌ Error")
+
+    async def _save_summaries(self, summaries: Dict[str, str]) -> None:
+        """Store batch summaries in their meetings, keyed by file path.
+
+        The current meeting is skipped, it is still being written to.
+        """
+        store = self.app.meeting_store
+        current = store.current_meeting
+        for stored in await store.load_meetings(summaries):
+            if stored is current or stored.file_path is None:
+                continue
+            stored.summary = summaries[stored.file_path]
+            await store.save_meeting_async(stored)
+
+    @staticmethod
+    def _meeting_data(meeting: MeetingNote) -> Dict[str, Any]:
+        """Meeting fields passed to the OpenAI service for a summary."""
+        # Ended meetings carry the formatted date and duration in their
+        # metadata, only format them for meetings still in progress
+        metadata = meeting.metadata
+        date = metadata.get("date") or meeting.start_time.strftime("%Y-%m-%d")
+        duration = metadata.get("duration") or (
+            str(meeting.duration) if meeting.duration else "Unknown"
+        )
+        return {
+            "title": meeting.title,
+            "date": date,
+            "duration": duration,
+            "participants": ", ".join(meeting.participants),
+            "content": meeting.raw_text,
+        }
+
     def toggle_log_level(self) -> None:
         """Handle log level toggle action."""
-        levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
         current_level = self.app.logger.logger.getEffectiveLevel()
-        current_index = levels.index(logging.getLevelName(current_level))
-        next_index = (current_index + 1) % len(levels)
-        new_level = levels[next_index]
+        new_level = _NEXT_LOG_LEVEL[current_level]
 
         self.app.logger.set_level(new_level)
         self.app.notify(f"Log level changed to {new_level}", title="🔍 Log Level")
@@ -1,5 +1,7 @@
 import asyncio
+import logging
 import signal
+import time
 from datetime import datetime
 from typing import Optional, List, Any, AsyncGenerator, Tuple
 
@@ -8,12 +10,15 @@ from rich.text import Text
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal
+from textual.timer import Timer as TextualTimer
 from textual.widgets import Header, Footer, Button
 from textual.widgets import Label as TextualLabel, Log as TextualLog
 
 from src.audio_capture import AudioCapture
 from src.config import Config
 from src.logger import AppLogger
+from src.markdown_renderer import MarkdownRenderer
+from src.meeting_note import MeetingNote
 from src.meeting_store import MeetingStore
 from src.protocol_writer import ProtocolWriter
 from src.services.openai_service import OpenAIService
@@ -29,186 +34,17 @@ class Timer(TextualLabel):
 
     def update_time(self, text: str) -> None:
         """Update the timer text."""
-        pass
 
 
 class Status(TextualLabel):
-    """Custom status widget with update method."""
-
-    def update(self, text: str) -> None:
-        """Update the status text."""
-        pass
-        # self.update_content(text)
+    """Custom status widget."""
 
 
 class TranscriberUI(App):
     """A Textual app for managing meeting transcription."""
 
-    CSS = """
-    Screen {
-        align: center middle;
-        layers: below above;
-    }
-
-    #sidebar {
-        dock: left;
-        width: 15;
-        height: 100%;
-        background: $boost;
-        padding: 1;
-    }
-
-    #content {
-        width: 100%;
-        height: 100%;
-        padding: 1;
-        overflow: hidden;
-    }
-
-    #transcript {
-        height: 100%;
-        border: heavy $accent;
-        background: $surface;
-        margin: 1;
-        padding: 1;
-        overflow-y: scroll;
-        content-align: center middle;
-        text-align: center;
-    }
-
-    /* Style for the transcript text */
-    #transcript > * {
-        text-align: center;
-        margin: 1 1;
-        width: 80%;
-    }
-
-    #transcript-container {
-        height: 100%;  # Take full height
-        margin: 1;
-        layout: grid;
-        grid-size: 1;
-        grid-rows: 2fr 1fr;  # 2/3 for markdown, 1/3 for logs
-        overflow: hidden;
-    }
-
-    #meeting-content {
-        height: 100%;     # Take full height of grid cell
-        border: heavy $accent;
-        background: $surface;
-        margin: 0 0 1 0;  # Add bottom margin instead of row-gap
-        padding: 1;
-        overflow-y: auto;
-    }
-
-    #log {
-        height: 100%;     # Take full height of grid cell
-        border: heavy $accent;
-        background: $surface-darken-1;
-        margin: 0;        # Remove margin to fill space
-        margin-bottom: 3; # Keep margin for footer
-        padding: 1;
-        overflow-y: auto;
-        text-style: none;
-        content-align: left top;
-    }
-
-    .action_button {
-        width: 100%;
-        margin: 1 0;
-        background: $primary;
-    }
-
-    .action_button:hover {
-        background: $primary-lighten-2;
-    }
-
-    .action_button_recording {
-        background: $error;
-    }
-
-    .action_button_recording:hover {
-        background: $error-lighten-2;
-    }
-
-    .status-bar {
-        height: 3;
-        background: $boost;
-        color: $text;
-    }
-
-    .recording-label {
-        color: $error;
-        text-style: bold;
-    }
-
-    Label {
-        content-align: center middle;
-        width: 100%;
-        padding: 1;
-    }
-
-    #timer {
-        text-align: right;
-        padding-right: 2;
-    }
-
-    #status {
-        text-align: left;
-        padding-left: 2;
-    }
-
-    #audio-meter {
-        dock: top;
-        height: 10;
-        width: 100%;
-        margin: 0;
-        background: $surface-darken-1;
-        border-bottom: solid $primary;
-        padding: 0 1;
-    }
-
-    #meeting-modal {
-        background: $surface;
-        padding: 1;
-        border: heavy $accent;
-        width: 60;
-        height: 20;
-        margin: 1;
-    }
-
-    #meeting-modal Input, #meeting-modal TextArea {
-        margin: 1;
-        width: 100%;
-    }
-
-    Footer {
-        background: $boost;
-        color: $text-muted;
-        dock: bottom;
-        height: 3;
-    }
-
-    MeetingForm {
-        width: 100%;
-        height: 100%;
-        dock: top;
-        margin: 1;
-        padding: 1;
-        border: heavy $accent;
-        background: $surface;
-    }
-
-    .language_button {
-        width: 100%;
-        margin: 1 0;
-        background: $primary-darken-2;
-    }
-
-    .language_button:hover {
-        background: $primary-darken-1;
-    }
-    """
+    # Parsed by Textual from the stylesheet next to this module
+    CSS_PATH = "app.tcss"
 
     BINDINGS = [
         Binding("q", "quit", "Quit", show=True),
@@ -216,14 +52,27 @@ class TranscriberUI(App):
         Binding("n", "new_meeting", "New Meeting", show=True),
         Binding("space", "toggle_recording", "Start/Stop", show=True),
         Binding("m", "summarize", "Summarize", show=True),
+        Binding("b", "summarize_all", "Summarize All", show=True),
     ]
 
+    # Seconds to collect transcribed lines before showing them in the meeting
+    render_delay = 0.5
+    # Transcript lines shown in the meeting view, the saved meeting keeps all
+    render_window = 200
+    # Seconds to collect transcribed lines before writing them to the log pane
+    log_delay = 0.25
+    # Lines kept in the log pane, so it doesn't slow down in long meetings
+    log_max_lines = 500
+
     def __init__(
-        self, default_participant: Optional[str] = None, create_sample: bool = False
+        self,
+        default_participant: Optional[str] = None,
+        create_sample: bool = False,
+        config: Optional[Config] = None,
     ):
         super().__init__()
-        # Initialize config first
-        self.config = Config()
+        # Initialize config first, reusing the one already loaded by the caller
+        self.config = config or Config()
 
         # Initialize core components
         self.meeting_store = MeetingStore(
@@ -237,11 +86,33 @@ class TranscriberUI(App):
         self.recording = False
         self.paused = False
         self.start_time: Optional[datetime] = None
+        # time.monotonic() at start_time, the timer counts from it
+        self._started_at = 0.0
         self._transcription_task: Optional[asyncio.Task] = None
-        self._timer_task: Optional[asyncio.Task] = None
+        # Consumer of audio_stream, awaited before the stream is torn down
+        self._audio_task: Optional[asyncio.Task] = None
+        # Interval updating the timer and status while recording
+        self._timer_interval: Optional[TextualTimer] = None
+        # Status line the timer last showed, and the state it was built for
+        self._status_key: Optional[Tuple[bool, str]] = None
+        self._status_cache = Text()
         self.audio_stream: Optional[AsyncGenerator[bytes, None]] = None
         self.protocol_writer: Optional[ProtocolWriter] = None
         self.last_minute: Optional[str] = None
+        # Pending debounced render, and what the meeting view shows: the
+        # meeting and its header, the delta_seq of its last transcript line
+        # and the number of transcript lines
+        self._render_handle: Optional[asyncio.TimerHandle] = None
+        self._rendered_meeting: Optional[MeetingNote] = None
+        self._rendered_header = ""
+        self._rendered_seq = 0
+        self._rendered_lines = 0
+        # Transcribed lines waiting for the next log pane write
+        self._log_batch: List[str] = []
+        self._log_handle: Optional[asyncio.TimerHandle] = None
+        # Loop the app runs on, set in on_mount for the SIGINT handler
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._shutdown_task: Optional[asyncio.Task] = None
 
         # Initialize audio capture with config
 
@@ -255,6 +126,7 @@ class TranscriberUI(App):
         """Handle app startup."""
         try:
             # Set up signal handler for Ctrl+C
+            self._loop = asyncio.get_running_loop()
             signal.signal(signal.SIGINT, self.handle_sigint)
 
             # Initial logging setup
@@ -264,24 +136,27 @@ class TranscriberUI(App):
                 self.config.get_path("logs"), log_settings["file_logging_enabled"]
             )
 
+            # Look up the widgets updated on every transcribed line and timer
+            # tick once, they stay mounted for the lifetime of the app
+            self._log_widget = self.query_one("#log", TextualLog)
+            self._meeting_content = self.query_one("#meeting-content", TextualLog)
+            self._timer_widget = self.query_one("#timer", Timer)
+            self._status_widget = self.query_one("#status", Status)
+            # and the buttons updated on every recording state change
+            self._start_button = self.query_one("#start_recording", Button)
+            self._edit_button = self.query_one("#edit_meeting", Button)
+            self._language_button = self.query_one("#toggle_language", Button)
+
             # Set up logger with UI widget
-            log_widget = self.query_one("#log")
-            self.logger.set_log_widget(log_widget)
+            self.logger.set_log_widget(self._log_widget)
 
             # Set up audio meter - REMOVE this duplicate widget creation
             # meter = self.query_one("#audio-meter", AudioMeter)  # Remove this
             # Instead, just get the existing widget
             meter = self.query_one("#audio-meter", AudioMeter)
-            audio_config = self.config.config.get(
-                "audio",
-                {
-                    "enabled": True,
-                    "format": pyaudio.paFloat32,
-                    "channels": 1,
-                    "rate": 16000,
-                    "chunk": 1024,
-                },
-            )
+            audio_config = self.config.get_audio_settings()
+            # Bytes per sample of the configured format, for the meter
+            sample_width = pyaudio.get_sample_size(audio_config["format"])
 
             self.audio_capture = AudioCapture(
                 format=audio_config["format"],
@@ -290,21 +165,14 @@ class TranscriberUI(App):
                 chunk=audio_config["chunk"],
                 enabled=audio_config["enabled"],
                 logger=self.logger.logger,
-                level_callback=lambda data: meter.update_level(data, format_width=4),
+                level_callback=lambda data: meter.update_level(
+                    data, format_width=sample_width
+                ),
             )
 
             # Update UI to show initial meeting content
             self._update_recording_ui()
 
-            # Render initial markdown if there's a current meeting
-            if self.meeting_store.current_meeting:
-                meeting_content = self.query_one("#meeting-content", TextualLog)
-                from src.markdown_renderer import MarkdownRenderer
-
-                markdown = MarkdownRenderer.render(self.meeting_store.current_meeting)
-                meeting_content.clear()
-                meeting_content.write(markdown)
-
             self.logger.logger.info("Application started")
             self.logger.logger.info(
                 f"Audio capture initialized with format: {pyaudio.paFloat32}"
@@ -314,6 +182,10 @@ class TranscriberUI(App):
             self.logger.logger.error(f"Error during app initialization: {e}")
             raise
 
+    async def on_unmount(self) -> None:
+        """Release the OpenAI connections when the app shuts down."""
+        await self.openai_service.close()
+
     def compose(self) -> ComposeResult:
         """Create child widgets for the app."""
         # Header section
@@ -351,12 +223,12 @@ class TranscriberUI(App):
                     yield Status("Ready", id="status")
                     yield Timer("00:00:00", id="timer")
 
-                # Meeting content area
+                # Meeting content area. Neither log is highlighted, that would
+                # run Rich's repr regexes over every line written.
                 with Container(id="transcript-container"):
-                    yield TextualLog(
-                        id="meeting-content", highlight=True
-                    )  # For rendered markdown
-                    yield TextualLog(id="log", highlight=True)  # For debug logs
+                    yield TextualLog(id="meeting-content")  # For rendered markdown
+                    # For debug logs, older lines are dropped
+                    yield TextualLog(id="log", max_lines=self.log_max_lines)
 
         yield Footer()
 
@@ -364,13 +236,17 @@ class TranscriberUI(App):
         """Pull text from the SpeechTranscriber queue and add it to the meeting."""
         self.logger.logger.info("Starting local transcription consumer task")
         transcript_queue = self.transcriber.get_transcript_queue()
+        # Type of the last error logged with a traceback, reset once a line
+        # goes through again
+        last_error: Optional[type] = None
 
         try:
             self.logger.logger.debug("Entering transcription processing loop")
             while self.recording and not self.paused:
                 try:
-                    # Wait for recognized text with a timeout
-                    text = await asyncio.wait_for(transcript_queue.get(), timeout=0.5)
+                    # stop_recording and pause_recording cancel this task, so
+                    # there is no need to wake up and check for them
+                    text = await transcript_queue.get()
 
                     text = text.strip()
                     if not text:
@@ -380,54 +256,43 @@ class TranscriberUI(App):
                         try:
                             # Add to meeting store
                             self.meeting_store.add_content(text)
-                            self.logger.logger.debug(f"Added to meeting store: {text}")
+                            if self.logger.logger.isEnabledFor(logging.DEBUG):
+                                self.logger.logger.debug(
+                                    f"Added to meeting store: {text}"
+                                )
 
                             # Update log pane
-                            log = self.query_one("#log", TextualLog)
-                            log.write(f"[{datetime.now().strftime('%H:%M:%S')}] {text}")
-
-                            # Update meeting content display
-                            meeting_content = self.query_one(
-                                "#meeting-content", TextualLog
+                            self._queue_log_line(
+                                f"[{time.strftime('%H:%M:%S')}] {text}"
                             )
-                            from src.markdown_renderer import MarkdownRenderer
 
-                            try:
-                                markdown = MarkdownRenderer.render(
-                                    self.meeting_store.current_meeting
-                                )
-                                meeting_content.clear()
-                                meeting_content.write(markdown)
-                                self.logger.logger.debug("Updated markdown display")
-                            except Exception as e:
-                                self.logger.logger.error(
-                                    f"Error rendering markdown: {e}"
-                                )
+                            # Update meeting content display
+                            self.schedule_render()
 
-                            # Save meeting after each update
-                            self.meeting_store.current_meeting.save()
+                            # add_content already persisted the new line
 
-                            self.logger.logger.debug(
-                                f"Meeting state - Raw text length: {len(self.meeting_store.current_meeting.raw_text)}, "
-                                f"Content items: {len(self.meeting_store.current_meeting.content)}"
-                            )
+                            # raw_text joins the whole transcript, only when logged
+                            if self.logger.logger.isEnabledFor(logging.DEBUG):
+                                self.logger.logger.debug(
+                                    f"Meeting state - Raw text length: {len(self.meeting_store.current_meeting.raw_text)}, "
+                                    f"Content items: {len(self.meeting_store.current_meeting.content)}"
+                                )
+                            last_error = None
                         except Exception as e:
-                            self.logger.logger.error(
-                                f"Error processing transcribed text: {e}", exc_info=True
+                            last_error = self._log_loop_error(
+                                "Error processing transcribed text", e, last_error
                             )
                     else:
                         self.logger.logger.warning(
                             "Received transcription but no active meeting"
                         )
 
-                except asyncio.TimeoutError:
-                    continue
                 except asyncio.CancelledError:
                     self.logger.logger.info("Transcription task cancelled")
                     raise
                 except Exception as e:
-                    self.logger.logger.error(
-                        f"Error in transcription loop: {e}", exc_info=True
+                    last_error = self._log_loop_error(
+                        "Error in transcription loop", e, last_error
                     )
 
         except asyncio.CancelledError:
@@ -439,6 +304,21 @@ class TranscriberUI(App):
         finally:
             self.logger.logger.info("Local transcription consumer ended")
 
+    def _log_loop_error(
+        self, message: str, error: Exception, last_error: Optional[type]
+    ) -> type:
+        """Log an error from the transcription loop and return its type.
+
+        Only the first of a run of errors of the same type gets a traceback,
+        repeats are logged at debug level.
+        """
+        if type(error) is last_error:
+            if self.logger.logger.isEnabledFor(logging.DEBUG):
+                self.logger.logger.debug(f"{message} (repeated): {error}")
+        else:
+            self.logger.logger.error(f"{message}: {error}", exc_info=error)
+        return type(error)
+
     async def action_toggle_recording(self) -> None:
         """Handle recording toggle action from key binding."""
         self.logger.logger.debug("Toggle recording key binding pressed")
@@ -454,7 +334,7 @@ class TranscriberUI(App):
         self.logger.logger.info(f"Showing meeting form with title: {title}")
 
         # Get the meeting content widget and its parent
-        meeting_content = self.query_one("#meeting-content", TextualLog)
+        meeting_content = self._meeting_content
         container = meeting_content.parent
 
         # Hide meeting content
@@ -479,13 +359,22 @@ class TranscriberUI(App):
             self.notify("Meeting updated successfully!", title="✅ Success")
 
     def _update_recording_ui(self) -> None:
-        """Update UI based on recording state."""
+        """Update the controls and the rendered meeting."""
+        self._update_controls()
+        self.render_meeting()
+
+    def _update_controls(self) -> None:
+        """Update buttons, status and timer for the recording state.
+
+        Recording state changes don't touch the meeting, so they only need
+        this and not a new render.
+        """
         try:
             # Get UI elements
-            timer = self.query_one("#timer", Timer)
-            status = self.query_one("#status", Status)
-            start_button = self.query_one("#start_recording", Button)
-            edit_button = self.query_one("#edit_meeting", Button)
+            timer = self._timer_widget
+            status = self._status_widget
+            start_button = self._start_button
+            edit_button = self._edit_button
 
             # Update button states based on meeting existence
             has_meeting = self.meeting_store.current_meeting is not None
@@ -510,29 +399,84 @@ class TranscriberUI(App):
             if not self.recording or self.paused:
                 timer.update_time("00:00:00")
 
-            # Update meeting content if available
-            if self.meeting_store.current_meeting:
-                meeting_content = self.query_one("#meeting-content", TextualLog)
-                from src.markdown_renderer import MarkdownRenderer
+        except Exception as e:
+            self.logger.logger.error(f"Error updating UI: {e}")
 
-                try:
-                    markdown = MarkdownRenderer.render(
-                        self.meeting_store.current_meeting
-                    )
-                    meeting_content.clear()
-                    meeting_content.write(markdown)
-                except Exception as e:
-                    self.logger.logger.error(f"Error rendering markdown: {e}")
+    def _queue_log_line(self, line: str) -> None:
+        """Write a line to the log pane together with others from log_delay."""
+        self._log_batch.append(line)
+        if self._log_handle is None:
+            self._log_handle = asyncio.get_running_loop().call_later(
+                self.log_delay, self._flush_log
+            )
+
+    def _flush_log(self) -> None:
+        """Write the queued lines to the log pane in one go."""
+        if self._log_handle is not None:
+            self._log_handle.cancel()
+            self._log_handle = None
+        if self._log_batch:
+            self._log_widget.write_lines(self._log_batch)
+            self._log_batch.clear()
+
+    def schedule_render(self) -> None:
+        """Render the meeting once render_delay has passed.
+
+        Lines transcribed in the meantime are shown by the same render.
+        """
+        if self._render_handle is None:
+            self._render_handle = asyncio.get_running_loop().call_later(
+                self.render_delay, self.render_meeting
+            )
+
+    def render_meeting(self) -> None:
+        """Show the current meeting as markdown in the meeting content view."""
+        if self._render_handle is not None:
+            self._render_handle.cancel()
+            self._render_handle = None
 
+        meeting = self.meeting_store.current_meeting
+        if meeting is None:
+            return
+
+        try:
+            meeting_content = self._meeting_content
+            header = MarkdownRenderer.render_header(meeting)
+            added = meeting.delta_seq - self._rendered_seq
+            if (
+                meeting is self._rendered_meeting
+                and header == self._rendered_header
+                and self._rendered_lines
+                and 0 <= added
+                and self._rendered_lines + added <= 2 * self.render_window
+            ):
+                # Only transcript lines were added, append them. The view
+                # grows up to twice the window before it is redrawn, so long
+                # meetings aren't redrawn for every line once the window
+                # slides.
+                if added:
+                    _, lines = meeting.transcript_tail(added)
+                    meeting_content.write(lines + "\n")
+                    self._rendered_lines += added
+            else:
+                markdown = MarkdownRenderer.render(meeting, tail=self.render_window)
+                meeting_content.clear()
+                meeting_content.write(markdown)
+                _, shown = meeting.transcript_tail(self.render_window)
+                self._rendered_lines = shown.count("\n") + 1 if shown else 0
+            self._rendered_meeting = meeting
+            self._rendered_header = header
+            self._rendered_seq = meeting.delta_seq
         except Exception as e:
-            self.logger.logger.error(f"Error updating UI: {e}")
+            self._rendered_meeting = None
+            self.logger.logger.error(f"Error rendering markdown: {e}")
 
     async def _handle_form_result(
         self, result: Optional[Tuple[str, List[str], List[str]]]
     ) -> None:
         """Handle form submission result."""
         # Get widgets
-        meeting_content = self.query_one("#meeting-content", TextualLog)
+        meeting_content = self._meeting_content
         form = self.query_one(MeetingForm)
 
         # Remove form
@@ -563,27 +507,26 @@ class TranscriberUI(App):
 
         # Always update UI and render markdown
         self._update_recording_ui()  # Make sure to update UI after form result
-        if self.meeting_store.current_meeting:
-            from src.markdown_renderer import MarkdownRenderer
-
-            try:
-                markdown = MarkdownRenderer.render(self.meeting_store.current_meeting)
-                meeting_content.clear()
-                meeting_content.write(markdown)
-            except Exception as e:
-                self.logger.logger.error(f"Error rendering markdown: {e}")
-                meeting_content.write("Error displaying meeting content")
 
     async def _start_audio_capture(self) -> None:
         """Start capturing audio (async)."""
         self.logger.logger.debug("Starting audio capture")
         generator = self.audio_capture.start_stream()
         self.audio_stream = generator
-        asyncio.create_task(self._process_audio())
+        self._audio_task = asyncio.create_task(self._process_audio())
 
     async def _stop_audio_capture(self) -> None:
         """Stop capturing audio (async)."""
         self.logger.logger.debug("Stopping audio capture")
+        task, self._audio_task = self._audio_task, None
+        # _process_audio stops the recording itself on errors, it can't wait
+        # for its own task
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
         if self.audio_stream is not None:
             # If your AudioCapture has a stop_stream method:
             await self.audio_capture.stop_stream()
@@ -622,8 +565,9 @@ class TranscriberUI(App):
 
                 # Mark our start time, start the timer UI
                 self.start_time = datetime.now()
-                await self._start_timer()
-                self._update_recording_ui()
+                self._started_at = time.monotonic()
+                self._start_timer()
+                self._update_controls()
                 self.logger.logger.info("Recording started successfully")
 
             except Exception as e:
@@ -636,7 +580,7 @@ class TranscriberUI(App):
                     self._transcription_task.cancel()
                 await self._stop_audio_capture()
                 self._stop_timer()
-                self._update_recording_ui()
+                self._update_controls()
                 await self.state.update_state(recording_state=RecordingState.STOPPED)
                 raise
 
@@ -672,14 +616,29 @@ class TranscriberUI(App):
                     pass
                 self._transcription_task = None
 
+            await self._save_meeting()
+            self._flush_log()
+
             # Stop the timer, update UI
             self._stop_timer()
-            self._update_recording_ui()
+            self._update_controls()
             self.logger.logger.info("Recording stopped")
         finally:
             await self.state.update_state(is_processing=False)
             await self._update_language_button()
 
+    async def _save_meeting(self) -> None:
+        """Write a full snapshot of the current meeting in a worker thread.
+
+        Only called once the transcription consumer is gone, so nothing
+        appends to the meeting while it is written.
+        """
+        meeting = self.meeting_store.current_meeting
+        if meeting is not None:
+            # Lines are appended on this loop, join them before handing over
+            meeting.compact_lines()
+            await self.meeting_store.save_meeting_async(meeting)
+
     async def _process_audio(self) -> None:
         """Process audio data in the background."""
         self.logger.logger.info("Starting audio processing")
@@ -694,10 +653,7 @@ class TranscriberUI(App):
                         "Recording stopped, ending audio processing"
                     )
                     break
-
-                # Process the audio data chunk
-                if self.audio_capture.level_callback:
-                    self.audio_capture.level_callback(audio_data)
+                # start_stream has already passed the chunk to the level meter
 
         except Exception as e:
             self.logger.logger.error(f"Audio processing error: {e}")
@@ -707,22 +663,25 @@ class TranscriberUI(App):
 
     def handle_sigint(self, signum: int, frame: Any) -> None:
         """Handle Ctrl+C gracefully."""
-        try:
-            # Try to get the current event loop, create a new one only if necessary
-            try:
-                loop = asyncio.get_event_loop()
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-
-            # Create a task to stop recording
-            loop.create_task(self.stop_recording())
-
-            # Exit the app
+        # The handler interrupts the main thread wherever it is, possibly in
+        # the middle of a loop callback, so only hand the shutdown to the loop
+        if self._loop is None or self._loop.is_closed():
             self.exit()
+            return
+        self._loop.call_soon_threadsafe(self._start_shutdown)
 
+    def _start_shutdown(self) -> None:
+        """Begin stopping the app, runs on the event loop."""
+        if self._shutdown_task is None:
+            self._shutdown_task = asyncio.create_task(self._shutdown())
+
+    async def _shutdown(self) -> None:
+        """Stop recording, then exit the app."""
+        try:
+            await self.stop_recording()
         except Exception as e:
             self.logger.logger.error(f"Error handling SIGINT: {e}")
+        finally:
             # Make sure we exit even if there's an error
             self.exit()
 
@@ -779,65 +738,60 @@ class TranscriberUI(App):
                 self.meeting_store.add_content(text)
 
                 # Update the UI to show the new content
-                meeting_content = self.query_one("#meeting-content", TextualLog)
-                from src.markdown_renderer import MarkdownRenderer
-
-                try:
-                    markdown = MarkdownRenderer.render(
-                        self.meeting_store.current_meeting
-                    )
-                    meeting_content.clear()
-                    meeting_content.write(markdown)
-                except Exception as e:
-                    self.logger.logger.error(f"Error rendering markdown: {e}")
-                    meeting_content.write("Error displaying meeting content")
+                self.schedule_render()
 
                 # Also log to the log pane
-                log = self.query_one("#log", TextualLog)
-                log.write(f"[{datetime.now().strftime('%H:%M:%S')}] {text}")
+                self._queue_log_line(f"[{time.strftime('%H:%M:%S')}] {text}")
 
-                # Save after each transcript to preserve content
-                self.meeting_store.current_meeting.save()
+                # add_content already persisted the new line
 
                 # Debug log the current state
-                self.logger.logger.debug(
-                    f"Current raw text length: {len(self.meeting_store.current_meeting.raw_text)}"
-                )
+                if self.logger.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.logger.debug(
+                        f"Current raw text length: {len(self.meeting_store.current_meeting.raw_text)}"
+                    )
 
         except Exception as e:
             self.logger.logger.error(f"Error adding transcript: {e}")
 
-    async def _start_timer(self) -> None:
-        """Start the recording timer."""
-        self._timer_task = asyncio.create_task(self._run_timer())
-
-    async def _run_timer(self) -> None:
-        """Run the timer loop."""
-        timer = self.query_one("#timer", Timer)
-        while self.recording:
-            if self.start_time:
-                elapsed = datetime.now() - self.start_time
-                timer.update_time(str(elapsed).split(".")[0])  # Remove microseconds
-
-                # Update status with current meeting info
-                if self.meeting_store.current_meeting:
-                    status = self.query_one("#status", Status)
-                    status_text = "🔴 Recording" if not self.paused else "⏸ Paused"
-                    status.update(
-                        Text(
-                            f"{status_text} - {self.meeting_store.current_meeting.title}",
-                            style="bold red" if not self.paused else "yellow",
-                        )
-                    )
+    def _start_timer(self) -> None:
+        """Start the recording timer, ticking once a second."""
+        if self._timer_interval is None:
+            self._timer_interval = self.set_interval(1.0, self._tick_timer)
+        self._tick_timer()
 
-            await asyncio.sleep(1)
+    def _tick_timer(self) -> None:
+        """Show the recording time and the current meeting in the status."""
+        if not self.recording or not self.start_time:
+            return
+
+        minutes, seconds = divmod(int(time.monotonic() - self._started_at), 60)
+        hours, minutes = divmod(minutes, 60)
+        self._timer_widget.update_time(f"{hours:02d}:{minutes:02d}:{seconds:02d}")
+
+        # Update status with current meeting info
+        meeting = self.meeting_store.current_meeting
+        if meeting:
+            self._status_widget.update(self._status_text(self.paused, meeting.title))
+
+    def _status_text(self, paused: bool, title: str) -> Text:
+        """Status line shown while recording, rebuilt only when it changes."""
+        key = (paused, title)
+        if key != self._status_key:
+            self._status_key = key
+            status_text = "🔴 Recording" if not paused else "⏸ Paused"
+            self._status_cache = Text(
+                f"{status_text} - {title}",
+                style="bold red" if not paused else "yellow",
+            )
+        return self._status_cache
 
     def _stop_timer(self) -> None:
         """Stop the recording timer."""
-        if self._timer_task and not self._timer_task.done():
-            self._timer_task.cancel()
-        self._timer_task = None
-        self.query_one("#timer", Timer).update_time("00:00:00")
+        if self._timer_interval is not None:
+            self._timer_interval.stop()
+            self._timer_interval = None
+        self._timer_widget.update_time("00:00:00")
 
     def action_summarize(self) -> None:
         """Show summary of current meeting."""
@@ -848,6 +802,11 @@ class TranscriberUI(App):
         else:
             self.notify("No active meeting!", title="📝 Summary")
 
+    async def action_summarize_all(self) -> None:
+        """Summarize all stored meetings through the Batch API."""
+        self.logger.logger.info("Summarize all key binding pressed")
+        await self.action_handler.summarize_all()
+
     async def pause_recording(self) -> None:
         """Pause the current recording."""
         try:
@@ -871,9 +830,11 @@ class TranscriberUI(App):
                     pass
                 self._transcription_task = None
 
+            await self._save_meeting()
+
             await self._stop_audio_capture()
             self._stop_timer()
-            self._update_recording_ui()
+            self._update_controls()
             self.logger.logger.info("Recording paused")
         finally:
             await self.state.update_state(is_processing=False)
@@ -896,8 +857,8 @@ class TranscriberUI(App):
                     self._process_transcription()
                 )
 
-                await self._start_timer()
-                self._update_recording_ui()
+                self._start_timer()
+                self._update_controls()
                 self.logger.logger.info("Recording resumed")
         finally:
             await self.state.update_state(is_processing=False)
@@ -910,12 +871,12 @@ class TranscriberUI(App):
 
     async def _update_language_button(self) -> None:
         """Update language button text based on current state."""
-        state = await self.state.get_state()
-        button = self.query_one("#toggle_language", Button)
+        state = self.state.get_state()
+        button = self._language_button
 
         # Update button text and state
         lang_text = (
             "🌍 EN" if state.language == TranscriptionLanguage.ENGLISH else "🌍 DE"
         )
         button.label = lang_text
-        button.disabled = not await self.state.can_toggle_language()
+        button.disabled = not self.state.can_toggle_language()
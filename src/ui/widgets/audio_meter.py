@@ -1,19 +1,27 @@
 import time
-from collections import deque
+from itertools import groupby
+from operator import itemgetter
 from typing import Any, Optional
 
 import numpy as np
-import plotext as plt
 from rich.segment import Segment
 from rich.style import Style
+from textual import events
 from textual.reactive import reactive
 from textual.strip import Strip
 from textual.widget import Widget
 
+from src.audio_level import compute_rms
+
+# Partly filled cells, indexed by the filled eighths
+_BLOCKS = " ▁▂▃▄▅▆▇█"
+_LEVEL_STYLE = Style(color="white")
+_PEAK_STYLE = Style(color="red")
+
 
 class AudioMeter(Widget):
-    """A widget that displays audio input levels over time using plotext,
-    with a grey background, filling the widget's width."""
+    """A widget that displays audio input levels over time as block
+    characters, with a grey background, filling the widget's width."""
 
     DEFAULT_CSS = """
     AudioMeter {
@@ -32,15 +40,14 @@ class AudioMeter(Widget):
         self.max_level = 0.0
         self.decay = 0.05
         self.history_size = 40
-        # Initialize with exact size to prevent resizing artifacts
-        self.history = deque([0.0] * self.history_size, maxlen=self.history_size)
-        self.max_history = deque([0.0] * self.history_size, maxlen=self.history_size)
-        self.time_points = list(range(self.history_size))  # Left to right
+        # Ring buffers of the levels and their decaying maximum, _head is
+        # the index of the oldest value and the next one to overwrite
+        self.history = np.zeros(self.history_size, dtype=np.float32)
+        self.max_history = np.zeros(self.history_size, dtype=np.float32)
+        self._head = 0
         self.last_update = time.time()
         self.update_interval = 0.1
         self._last_level = 0.0
-        self._sample_count = 0
-        self._level_sum = 0.0
         self._last_logged_level = 0.0
         self._log_threshold = 0.01
         self._dynamic_max = 0.1
@@ -48,171 +55,146 @@ class AudioMeter(Widget):
         self._min_level = 0.001
         self._cleanup_threshold = 0.005
 
-        # We'll keep a cached list of strings representing each line of the plot,
+        # We'll keep a cached list of strips representing each line of the plot,
         # so we don't rebuild the plot 10 times every frame. This will be set to `None`
         # whenever something changes (e.g. `level` changes).
-        self._plot_render_cache: Optional[list[str]] = None
+        self._plot_render_cache: Optional[list[Strip]] = None
 
     def update_level(self, audio_data: bytes, format_width: int = 4) -> None:
         """Update the audio level from raw audio data."""
         try:
             current_time = time.time()
+            # Chunks arriving between display updates aren't shown, so don't
+            # decode them at all
+            if current_time - self.last_update < self.update_interval:
+                return
 
-            # Convert bytes to numpy array based on format
+            # Calculate RMS level on a view of the bytes, without converting
+            # or squaring into temporary arrays, the peak isn't shown
             if format_width == 4:  # Float32
-                samples = np.frombuffer(audio_data, dtype=np.float32)
+                rms = compute_rms(np.frombuffer(audio_data, dtype=np.float32))
             elif format_width == 2:  # Int16
-                samples = (
-                    np.frombuffer(audio_data, dtype=np.int16).astype(np.float32)
-                    / 32768.0
-                )
+                rms = compute_rms(np.frombuffer(audio_data, dtype=np.int16), 32768.0)
             else:
                 return
 
-            # Calculate RMS level
-            rms = np.sqrt(np.mean(samples**2))
             level = min(1.0, rms * 8.0)  # Amplification factor
 
-            # Accumulate levels
-            self._level_sum += level
-            self._sample_count += 1
-
-            # Update display periodically
-            if current_time - self.last_update >= self.update_interval:
-                # Calculate average level
-                avg_level = (
-                    self._level_sum / self._sample_count
-                    if self._sample_count > 0
-                    else 0.0
-                )
-
-                # Apply smoothing
-                smoothing = 0.5
-                self.level = smoothing * self._last_level + (1 - smoothing) * avg_level
+            # Apply smoothing, the latest chunk stands for the whole interval
+            smoothing = 0.5
+            self.level = smoothing * self._last_level + (1 - smoothing) * level
 
-                # Update dynamic maximum level
-                if self.level > self._dynamic_max:
-                    self._dynamic_max = self.level
+            # Update dynamic maximum level
+            if self.level > self._dynamic_max:
+                self._dynamic_max = self.level
+            else:
+                # Faster decay when level is very low
+                if self.level < self._min_level:
+                    self._dynamic_max *= 0.95  # Faster decay
                 else:
-                    # Faster decay when level is very low
-                    if self.level < self._min_level:
-                        self._dynamic_max *= 0.95  # Faster decay
-                    else:
-                        self._dynamic_max *= self._max_decay_rate
-
-                # Keep max level above a minimum threshold
-                self._dynamic_max = max(self._dynamic_max, 0.1)
-
-                # Clean up very low levels
-                if self.level < self._cleanup_threshold:
-                    self.level = 0.0
-
-                # Update histories - shift left and add new value at right
-                self.history.rotate(-1)
-                self.history[-1] = self.level
-
-                self.max_history.rotate(-1)
-                self.max_history[-1] = self._dynamic_max
-
-                # Force complete redraw
-                self.refresh(layout=True)  # Force layout recalculation
-
-                self._last_level = self.level
-
-                # Log levels
-                if abs(self.level - self._last_logged_level) > self._log_threshold:
-                    self.log.debug(
-                        f"Audio level: {self.level:.3f} | "
-                        f"Dynamic max: {self._dynamic_max:.3f} | "
-                        f"RMS: {rms:.3f}"
-                    )
-                    self._last_logged_level = self.level
+                    self._dynamic_max *= self._max_decay_rate
+
+            # Keep max level above a minimum threshold
+            self._dynamic_max = max(self._dynamic_max, 0.1)
+
+            # Clean up very low levels
+            if self.level < self._cleanup_threshold:
+                self.level = 0.0
+
+            # Update histories - overwrite the oldest value
+            self.history[self._head] = self.level
+            self.max_history[self._head] = self._dynamic_max
+            self._head = (self._head + 1) % len(self.history)
+
+            # The histories moved even if the level stayed the same, in
+            # which case watch_level doesn't run
+            self._plot_render_cache = None
+
+            self._last_level = self.level
+
+            # Log levels, as keyword arguments Textual only formats them when
+            # the log goes to devtools or a log file
+            if abs(self.level - self._last_logged_level) > self._log_threshold:
+                self.log.debug(
+                    "Audio level",
+                    level=round(self.level, 3),
+                    dynamic_max=round(self._dynamic_max, 3),
+                    rms=round(rms, 3),
+                )
+                self._last_logged_level = self.level
 
-                # Reset accumulators
-                self._level_sum = 0.0
-                self._sample_count = 0
-                self.last_update = current_time
+            self.last_update = current_time
 
-                self.refresh()
+            # Only the rows changed, the meter keeps its size
+            self.refresh()
 
         except Exception as e:
             self.log.error(f"Error in update_level: {e}")
 
-    def _build_plot(self) -> list[str]:
-        """Build the entire plot text once and return it as a list of lines."""
-        plt.clear_figure()
-        plt.clear_data()
-
-        plot_width = max(self.size.width, 1)
-        plot_height = self.size.height
+    def _render_rows(self, width: int, height: int) -> list[Strip]:
+        """Draw the level history as block characters, one strip per row.
 
-        plt.plotsize(plot_width, plot_height)
-        plt.theme("dark")
-        plt.grid(False)
-
-        plt.plot(self.time_points, list(self.history), color="white", marker="braille")
-        plt.plot(
-            self.time_points, list(self.max_history), color="red", marker="braille"
-        )
-
-        max_y = max(max(self.max_history), 0.1)
-        plt.ylim(0, max_y * 1.2)
-
-        plt.xlabel("")
-        plt.ylabel("")
-        plt.ticks_color("white")
-        plt.frame(False)
-        plt.yticks([])
-        plt.xticks([])
-
-        # Build & split into lines (strings)
-        full_plot = plt.build()
-        return (
-            full_plot.split("\n") if isinstance(full_plot, str) else []
-        )  # Ensure str return type
+        Each cell shows eighths of a block, the decaying maximum is drawn
+        as a red line over the empty cells.
+        """
+        size = len(self.history)
+        max_y = max(float(self.max_history.max()), 0.1) * 1.2
+        scale = height * 8 / max_y
+
+        # History index shown in each column, oldest on the left
+        columns = (self._head + np.arange(width) * size // width) % size
+
+        # Eighths of a cell filled in each column, and the row of its peak
+        fills = np.minimum((self.history[columns] * scale).astype(int), height * 8)
+        peak_cells = (self.max_history[columns] * scale).astype(int) // 8
+        peaks = height - 1 - np.minimum(peak_cells, height - 1)
+
+        rows = []
+        for y in range(height):
+            base = (height - 1 - y) * 8
+            cells = []
+            for fill, peak in zip(fills.tolist(), peaks.tolist()):
+                level = fill - base
+                if level > 0:
+                    cells.append((_BLOCKS[min(level, 8)], _LEVEL_STYLE))
+                elif y == peak:
+                    cells.append(("─", _PEAK_STYLE))
+                else:
+                    cells.append((" ", _LEVEL_STYLE))
+            rows.append(
+                Strip(
+                    [
+                        Segment("".join(char for char, _ in run), style)
+                        for style, run in groupby(cells, key=itemgetter(1))
+                    ],
+                    width,
+                )
+            )
+        return rows
 
     def render_line(self, y: int) -> Strip:
         """
-        Render exactly one line y. We build (or reuse a cached) plot,
-        pick the correct line from it, and center it horizontally.
+        Render exactly one line y from the rows drawn once per refresh.
         """
+        width = self.size.width
         try:
-            # (Re)build the plot only once per refresh
             if self._plot_render_cache is None:
-                self._plot_render_cache = self._build_plot()
+                self._plot_render_cache = self._render_rows(
+                    max(width, 1), self.size.height
+                )
 
             if 0 <= y < len(self._plot_render_cache):
-                plot_line = self._plot_render_cache[y]
-            else:
-                plot_line = ""
-
-            # Trim trailing whitespace from plotext
-            plot_line = plot_line.rstrip()
-
-            # We want to center the plot line inside the full widget width.
-            line_len = len(plot_line)
-            total_width = self.size.width
-
-            # Left offset = half the remaining space, if any
-            left_pad = (total_width - line_len) // 2
-            if left_pad < 0:
-                # If the plot line somehow is longer (shouldn't happen unless widget is too narrow)
-                left_pad = 0
-
-            # Build final line with the left offset, then cut/pad to widget width
-            line_str = (" " * left_pad) + plot_line
-            # Ensure final line is exactly the widget width
-            if len(line_str) < total_width:
-                line_str = line_str.ljust(total_width)
-            elif len(line_str) > total_width:
-                line_str = line_str[:total_width]
-
-            return Strip([Segment(line_str, Style())])
+                return self._plot_render_cache[y]
+            return Strip.blank(width)
 
         except Exception as e:
             self.log.error(f"Error in render_line: {e}")
             # Fallback: Return an empty line if something fails
-            return Strip([Segment(" " * self.size.width, Style())])
+            return Strip.blank(width)
+
+    def on_resize(self, event: events.Resize) -> None:
+        """Rebuild the plot for the new size on the next render_line call."""
+        self._plot_render_cache = None
 
     def watch_level(self, old_value: float, new_value: float) -> None:
         """
@@ -144,14 +144,14 @@ def mock_components(mock_speech_sdk: Mock, mock_transcriber: Mock) -> Dict[str,
         language=TranscriptionLanguage.ENGLISH,
         is_processing=False,
     )
-    mock_state.get_state = AsyncMock(return_value=state_data)
-    mock_state.can_toggle_language = AsyncMock(return_value=True)
+    mock_state.get_state = Mock(return_value=state_data)
+    mock_state.can_toggle_language = Mock(return_value=True)
     mock_state.toggle_language = AsyncMock(
         side_effect=[TranscriptionLanguage.GERMAN, TranscriptionLanguage.ENGLISH]
     )
     mock_state.update_state = AsyncMock()
     mock_state.toggle_summarizing = AsyncMock()
-    mock_state.can_generate_summary = AsyncMock(return_value=True)
+    mock_state.can_generate_summary = Mock(return_value=True)
     components["state"] = mock_state
 
     # Create mock config
@@ -186,11 +186,11 @@ def mock_app() -> Mock:
 
     # Mock state
     app.state = AsyncMock()
-    app.state.can_generate_summary = AsyncMock(return_value=True)
+    app.state.can_generate_summary = Mock(return_value=True)
     app.state.toggle_summarizing = AsyncMock()
-    app.state.can_toggle_language = AsyncMock(return_value=True)
+    app.state.can_toggle_language = Mock(return_value=True)
     app.state.toggle_language = AsyncMock(return_value=TranscriptionLanguage.GERMAN)
-    app.state.get_state = AsyncMock(
+    app.state.get_state = Mock(
         return_value=AppStateData(
             recording_state=RecordingState.STOPPED,
             language=TranscriptionLanguage.ENGLISH,
@@ -1,5 +1,8 @@
+import json
+from typing import AsyncIterator
 from unittest.mock import Mock, AsyncMock
 
+import openai
 import pytest
 
 from src.services.openai_service import OpenAIService
@@ -18,11 +21,14 @@ async def test_generate_summary(monkeypatch: pytest.MonkeyPatch) -> None:
     }
     mock_config.get_system_prompt.return_value = "Test prompt {title}"
 
-    # Mock OpenAI client
+    # Mock OpenAI client streaming the summary in two chunks
+    async def stream() -> AsyncIterator[Mock]:
+        for content in ("Test ", "summary"):
+            yield Mock(choices=[Mock(delta=Mock(content=content))])
+        yield Mock(choices=[])
+
     mock_client = Mock()
-    mock_client.chat.completions.create = AsyncMock(
-        return_value=Mock(choices=[Mock(message=Mock(content="Test summary"))])
-    )
+    mock_client.chat.completions.create = AsyncMock(side_effect=lambda **_: stream())
 
     # Mock AsyncOpenAI constructor
     mock_openai = Mock()
@@ -33,8 +39,94 @@ async def test_generate_summary(monkeypatch: pytest.MonkeyPatch) -> None:
     service = OpenAIService(mock_config)
     result = await service.generate_summary({"title": "Test"})
     assert result == "Test summary"
+    assert mock_client.chat.completions.create.call_args.kwargs["stream"] is True
 
     # Test error handling
     mock_client.chat.completions.create.side_effect = Exception("API Error")
     with pytest.raises(RuntimeError, match="Error generating summary"):
         await service.generate_summary({"title": "Test"})
+
+
+@pytest.mark.asyncio
+async def test_summary_batch(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test submitting a summary batch and reading its results."""
+    mock_config = Mock()
+    mock_config.get_openai_settings.return_value = {
+        "api_key": "test_key",
+        "model": "gpt-4",
+        "temperature": 0.7,
+        "max_tokens": 1000,
+    }
+    mock_config.get_system_prompt.return_value = "Test prompt {title}"
+
+    mock_client = Mock()
+    mock_client.files.create = AsyncMock(return_value=Mock(id="file-in"))
+    mock_client.batches.create = AsyncMock(return_value=Mock(id="batch-1"))
+    monkeypatch.setattr("openai.AsyncOpenAI", Mock(return_value=mock_client))
+
+    service = OpenAIService(mock_config)
+    batch_id = await service.submit_summary_batch(
+        {"a.json": {"title": "A"}, "b.json": {"title": "B"}}
+    )
+    assert batch_id == "batch-1"
+
+    _, upload = mock_client.files.create.call_args.kwargs["file"]
+    requests = [json.loads(line) for line in upload.decode("utf-8").splitlines()]
+    assert [r["custom_id"] for r in requests] == ["a.json", "b.json"]
+    assert requests[0]["body"]["messages"][0]["content"] == "Test prompt A"
+    mock_client.batches.create.assert_awaited_once_with(
+        input_file_id="file-in",
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+
+    output = "\n".join(
+        [
+            json.dumps(
+                {
+                    "custom_id": "a.json",
+                    "response": {
+                        "status_code": 200,
+                        "body": {"choices": [{"message": {"content": "Summary A"}}]},
+                    },
+                }
+            ),
+            json.dumps(
+                {
+                    "custom_id": "b.json",
+                    "response": {"status_code": 500, "body": {}},
+                }
+            ),
+            "not json",
+        ]
+    )
+    mock_client.files.content = AsyncMock(return_value=Mock(text=output))
+    assert await service.retrieve_batch_results("file-out") == {"a.json": "Summary A"}
+
+    # API errors reach the caller as RuntimeError
+    mock_client.batches.retrieve = AsyncMock(side_effect=openai.OpenAIError("down"))
+    with pytest.raises(RuntimeError, match="Error polling summary batch: down"):
+        await service.poll_batch("batch-1")
+
+
+@pytest.mark.asyncio
+async def test_client_closed(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that each service pools its own client and closes it."""
+    mock_config = Mock()
+    mock_config.get_openai_settings.return_value = {
+        "api_key": "test_key",
+        "model": "gpt-4",
+        "temperature": 0.7,
+        "max_tokens": 1000,
+    }
+    mock_openai = Mock(side_effect=lambda **_: Mock(close=AsyncMock()))
+    monkeypatch.setattr("openai.AsyncOpenAI", mock_openai)
+
+    first = OpenAIService(mock_config)
+    second = OpenAIService(mock_config)
+    assert first.client is not second.client
+    assert mock_openai.call_args.kwargs["http_client"] is not None
+
+    await first.close()
+    first.client.close.assert_awaited_once()
+    second.client.close.assert_not_awaited()
@@ -33,7 +33,7 @@ def app_state(mock_components: Dict[str, Any]) -> AppState:
 
     # Mock toggle_language to actually toggle the language
     async def mock_toggle_language() -> Optional[TranscriptionLanguage]:
-        if not await state.can_toggle_language():
+        if not state.can_toggle_language():
             return None
         new_lang = (
             TranscriptionLanguage.GERMAN
@@ -44,7 +44,7 @@ def app_state(mock_components: Dict[str, Any]) -> AppState:
         return new_lang
 
     # Mock can_toggle_language to check state
-    async def mock_can_toggle_language() -> bool:
+    def mock_can_toggle_language() -> bool:
         return (
             state._state.recording_state == RecordingState.STOPPED
             and not state._state.is_processing
@@ -60,7 +60,7 @@ def app_state(mock_components: Dict[str, Any]) -> AppState:
 @pytest.mark.asyncio
 async def test_initial_state(app_state: AppState) -> None:
     """Test initial state values."""
-    state = await app_state.get_state()
+    state = app_state.get_state()
     assert state.recording_state == RecordingState.STOPPED
     assert state.language == TranscriptionLanguage.ENGLISH
     assert not state.is_processing
@@ -70,7 +70,7 @@ async def test_initial_state(app_state: AppState) -> None:
 async def test_update_state(app_state: AppState) -> None:
     """Test state update functionality."""
     await app_state.update_state(recording_state=RecordingState.RECORDING)
-    state = await app_state.get_state()
+    state = app_state.get_state()
     assert state.recording_state == RecordingState.RECORDING
 
     # Test invalid attribute
@@ -85,19 +85,19 @@ async def test_update_state(app_state: AppState) -> None:
 async def test_language_toggle(app_state: AppState) -> None:
     """Test language toggle functionality."""
     # Initial state should be English
-    state = await app_state.get_state()
+    state = app_state.get_state()
     assert state.language == TranscriptionLanguage.ENGLISH
 
     # Toggle to German
     new_language = await app_state.toggle_language()
     assert new_language == TranscriptionLanguage.GERMAN
-    state = await app_state.get_state()
+    state = app_state.get_state()
     assert state.language == TranscriptionLanguage.GERMAN
 
     # Toggle back to English
     new_language = await app_state.toggle_language()
     assert new_language == TranscriptionLanguage.ENGLISH
-    state = await app_state.get_state()
+    state = app_state.get_state()
     assert state.language == TranscriptionLanguage.ENGLISH
 
 
@@ -106,7 +106,7 @@ async def test_language_toggle_blocked(app_state: AppState) -> None:
     """Test language toggle is blocked appropriately."""
     # Block toggle during recording
     await app_state.update_state(recording_state=RecordingState.RECORDING)
-    assert not await app_state.can_toggle_language()
+    assert not app_state.can_toggle_language()
     new_lang = await app_state.toggle_language()
     assert new_lang is None
 
@@ -114,6 +114,22 @@ async def test_language_toggle_blocked(app_state: AppState) -> None:
     await app_state.update_state(
         recording_state=RecordingState.STOPPED, is_processing=True
     )
-    assert not await app_state.can_toggle_language()
+    assert not app_state.can_toggle_language()
     new_lang = await app_state.toggle_language()
     assert new_lang is None
+
+
+@pytest.mark.asyncio
+async def test_toggle_language_only_when_stopped() -> None:
+    """Test the real toggle rules without the fixture's stand-ins."""
+    state = AppState()
+    assert state.can_toggle_language()
+    assert await state.toggle_language() == TranscriptionLanguage.GERMAN
+
+    await state.update_state(recording_state=RecordingState.RECORDING)
+    assert not state.can_toggle_language()
+    assert await state.toggle_language() is None
+
+    await state.update_state(recording_state=RecordingState.PAUSED, is_processing=False)
+    assert await state.toggle_language() is None
+    assert state.get_state().language == TranscriptionLanguage.GERMAN
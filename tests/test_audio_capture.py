@@ -1,7 +1,9 @@
+import asyncio
 from typing import Any, AsyncGenerator
 from typing import Generator
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pyaudio
 import pytest
 
@@ -12,8 +14,13 @@ from src.audio_capture import AudioCapture
 def mock_pyaudio() -> Generator[MagicMock, None, None]:
     with patch("pyaudio.PyAudio") as mock:
         mock_stream = MagicMock()
-        mock_stream.read.return_value = b"test_audio_data"
-        mock.return_value.open.return_value = mock_stream
+
+        def open_stream(**kwargs: Any) -> MagicMock:
+            # Deliver one chunk (1024 float32 samples) through the stream callback
+            kwargs["stream_callback"](b"\x00" * (1024 * 4), 1024, {}, 0)
+            return mock_stream
+
+        mock.return_value.open.side_effect = open_stream
         yield mock
 
 
@@ -53,28 +60,20 @@ async def anext_compat(agen: AsyncGenerator[Any, Any]) -> Any:
 async def test_start_stream(mock_pyaudio: MagicMock) -> None:
     """Test starting the audio stream."""
     capture = AudioCapture(enabled=True)
-    # Mock the stream read to return valid data size
-    mock_stream = mock_pyaudio.return_value.open.return_value
-    mock_stream.read.return_value = b"\x00" * (
-        capture.chunk * 4
-    )  # 4 bytes per float32 sample
 
     # Get the generator and first chunk
     stream = capture.start_stream()
     data = await anext(stream)  # Use anext instead of awaiting the generator
 
-    assert len(data) == capture.chunk * 4
+    assert len(data) == capture.chunk * 4  # 4 bytes per float32 sample
+    _, kwargs = mock_pyaudio.return_value.open.call_args
+    assert kwargs["stream_callback"] == capture._pa_callback
 
 
 @pytest.mark.asyncio
 async def test_stop_stream(mock_pyaudio: MagicMock) -> None:
     """Test stopping the audio stream."""
     capture = AudioCapture(enabled=True)
-    # Mock the stream read to return valid data size
-    mock_stream = mock_pyaudio.return_value.open.return_value
-    mock_stream.read.return_value = b"\x00" * (
-        capture.chunk * 4
-    )  # 4 bytes per float32 sample
 
     # Get the generator and first chunk
     stream = capture.start_stream()
@@ -83,11 +82,29 @@ async def test_stop_stream(mock_pyaudio: MagicMock) -> None:
     await capture.stop_stream()
     assert capture.stream is None
 
+    # The blocked generator is woken up and finishes
+    with pytest.raises(StopAsyncIteration):
+        await anext(stream)
+
+
+@pytest.mark.asyncio
+async def test_queue_drops_oldest_when_full(mock_pyaudio: MagicMock) -> None:
+    """Test that a slow consumer only sees the most recent chunks."""
+    capture = AudioCapture(enabled=True, queue_size=2)
+    capture._queue = asyncio.Queue(maxsize=capture.queue_size)
+
+    for chunk in (b"1", b"2", b"3"):
+        capture._enqueue(chunk)
+
+    assert capture._queue.get_nowait() == b"2"
+    assert capture._queue.get_nowait() == b"3"
+
 
 @pytest.mark.asyncio
 async def test_audio_capture_disabled() -> None:
     """Test that disabled audio capture yields silent data."""
     capture = AudioCapture(enabled=False)
+    capture.silence_interval = 0
 
     # Get the generator
     stream = capture.start_stream()
@@ -95,8 +112,8 @@ async def test_audio_capture_disabled() -> None:
     # Get first chunk
     chunk = await anext(stream)
 
-    # Should be silent data
-    assert chunk == b"\x00" * capture.chunk
+    # Should be a block of silent data
+    assert chunk == b"\x00" * (capture.chunk * 10)
 
     # Clean up
     await capture.stop_stream()
@@ -118,3 +135,14 @@ async def test_audio_capture_enabled() -> None:
 
     # Clean up
     await capture.stop_stream()
+
+
+def test_measure_level_int16() -> None:
+    """Test that int16 chunks are scaled to [0, 1]."""
+    capture = AudioCapture(format=pyaudio.paInt16)
+    data = np.full(1024, -32768, dtype=np.int16).tobytes()
+
+    peak, rms = capture._measure_level(data)
+
+    assert peak == pytest.approx(1.0)
+    assert rms == pytest.approx(1.0)
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from src.audio_level import compute_level, compute_rms
+
+
+def test_compute_level_float32() -> None:
+    """Test peak and RMS of float32 samples."""
+    samples = np.array([0.5, -1.0, 0.5, 0.0], dtype=np.float32)
+
+    peak, rms = compute_level(samples)
+
+    assert peak == pytest.approx(1.0)
+    assert rms == pytest.approx(np.sqrt(1.5 / 4))
+
+
+def test_compute_level_int16_no_overflow() -> None:
+    """Test that int16 samples are accumulated without overflow."""
+    samples = np.full(1024, -32768, dtype=np.int16)
+
+    peak, rms = compute_level(samples, 32768.0)
+
+    assert peak == pytest.approx(1.0)
+    assert rms == pytest.approx(1.0)
+
+
+def test_compute_level_empty() -> None:
+    """Test that an empty buffer is silent."""
+    assert compute_level(np.zeros(0, dtype=np.float32)) == (0.0, 0.0)
+
+
+def test_compute_rms_matches_level() -> None:
+    """Test that compute_rms gives the RMS of compute_level."""
+    samples = np.array([1000, -2000, 3000], dtype=np.int16)
+
+    assert compute_rms(samples, 32768.0) == compute_level(samples, 32768.0)[1]
+    assert compute_rms(np.zeros(0, dtype=np.int16)) == 0.0
@@ -126,3 +126,37 @@ def test_default_user_settings(temp_config_file: Path) -> None:
 
     assert user_settings["default_participant"] == ""
     assert user_settings["create_default_meeting"] is False
+
+
+def test_credentials_resolved_once(
+    temp_config_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that credentials are resolved once and reused."""
+    monkeypatch.setenv("AZURE_SPEECH_KEY", "env_test_key")
+    config = Config(str(temp_config_file))
+    credentials = config.get_azure_credentials()
+
+    monkeypatch.setenv("AZURE_SPEECH_KEY", "changed_key")
+    assert config.get_azure_credentials() is credentials
+    assert config.get_azure_credentials()["speech_key"] == "env_test_key"
+
+
+def test_default_audio_settings(temp_config_file: Path) -> None:
+    """Test default audio settings when not specified in config."""
+    config = Config(str(temp_config_file))
+    audio_settings = config.get_audio_settings()
+
+    assert audio_settings["enabled"] is True
+    assert audio_settings["rate"] == 16000
+    assert audio_settings["chunk"] == 1600
+
+
+def test_missing_path_in_config(temp_config_file: Path) -> None:
+    """Test that a config without all paths is rejected on load."""
+    config_data = {"paths": {"logs": "test_logs", "meetings": "test_meetings"}}
+
+    with open(temp_config_file, "w") as f:
+        yaml.dump(config_data, f)
+
+    with pytest.raises(KeyError, match="screenshots"):
+        Config(str(temp_config_file))
@@ -0,0 +1,85 @@
+import asyncio
+import logging
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from src.logger import AppLogger, UILogHandler
+
+
+def make_record(created: float, message: str = "Test message") -> logging.LogRecord:
+    """Create a log record with a fixed creation time."""
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, message, None, None)
+    record.created = created
+    return record
+
+
+def test_ui_log_handler_formats_entry() -> None:
+    """Test that entries are written with time, level and message."""
+    handler = UILogHandler()
+    log_widget = Mock()
+    handler.set_log_widget(log_widget)
+
+    created = time.time()
+    handler.emit(make_record(created))
+
+    expected_time = time.strftime("%H:%M:%S", time.localtime(created))
+    log_widget.write.assert_called_once_with(f"{expected_time} INFO: Test message\n")
+
+
+def test_ui_log_handler_updates_timestamp() -> None:
+    """Test that the cached timestamp changes with the record second."""
+    handler = UILogHandler()
+    log_widget = Mock()
+    handler.set_log_widget(log_widget)
+
+    created = time.time()
+    handler.emit(make_record(created))
+    handler.emit(make_record(created + 1))
+
+    first = log_widget.write.call_args_list[0][0][0]
+    second = log_widget.write.call_args_list[1][0][0]
+    assert first[:8] == time.strftime("%H:%M:%S", time.localtime(created))
+    assert second[:8] == time.strftime("%H:%M:%S", time.localtime(created + 1))
+
+
+def test_ui_log_handler_without_widget() -> None:
+    """Test that records are dropped when no widget is set."""
+    handler = UILogHandler()
+    assert not handler.filter(make_record(time.time()))
+
+    handler.set_log_widget(Mock())
+    assert handler.filter(make_record(time.time()))
+
+
+@pytest.mark.asyncio
+async def test_ui_log_handler_batches_writes() -> None:
+    """Test that records emitted in a burst are written in one batch."""
+    handler = UILogHandler()
+    log_widget = Mock()
+    handler.set_log_widget(log_widget)
+
+    created = time.time()
+    for i in range(3):
+        handler.emit(make_record(created, f"Message {i}"))
+
+    # Nothing is written until the scheduled flush runs
+    log_widget.write.assert_not_called()
+
+    await asyncio.sleep(handler.flush_interval * 2)
+
+    log_widget.write.assert_called_once()
+    written = log_widget.write.call_args[0][0]
+    assert written.count("\n") == 3
+    assert "Message 0" in written and "Message 2" in written
+
+
+def test_app_logger_is_singleton() -> None:
+    """Test that AppLogger is set up once and shared."""
+    first = AppLogger()
+    second = AppLogger()
+
+    assert first is second
+    assert first.ui_handler in first.logger.handlers
+    assert first.logger.handlers.count(first.ui_handler) == 1
@@ -4,7 +4,11 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from src.config import Config
-from src.main import validate_azure_credentials, parse_arguments
+from src.main import (
+    install_event_loop,
+    parse_arguments,
+    validate_azure_credentials,
+)
 
 
 def test_validate_azure_credentials_valid() -> None:
@@ -40,6 +44,14 @@ def test_parse_arguments_defaults() -> None:
         assert args.config == "config.yaml"
 
 
+def test_parse_arguments_short_options() -> None:
+    """Test that short options still go through the full parser."""
+    with patch.object(sys, "argv", ["prog", "-c", "other.yaml"]):
+        args = parse_arguments()
+        assert args.output is None
+        assert args.config == "other.yaml"
+
+
 def test_parse_arguments_custom() -> None:
     """Test argument parsing with custom values."""
     test_args = [
@@ -53,3 +65,31 @@ def test_parse_arguments_custom() -> None:
         args = parse_arguments()
         assert args.output == "custom_output.txt"
         assert args.config == "custom_config.yaml"
+
+
+def test_install_event_loop_uses_uvloop() -> None:
+    """Test that uvloop is installed when available."""
+    mock_uvloop = MagicMock()
+    with patch.dict(sys.modules, {"uvloop": mock_uvloop}):
+        install_event_loop()
+    mock_uvloop.install.assert_called_once()
+
+
+def test_install_event_loop_without_uvloop() -> None:
+    """Test that a missing uvloop falls back to the default loop."""
+    with patch.dict(sys.modules, {"uvloop": None}):
+        # Should not raise an exception
+        install_event_loop()
+
+
+def test_install_event_loop_uses_winloop_on_windows() -> None:
+    """Test that winloop is installed instead of uvloop on Windows."""
+    mock_winloop = MagicMock()
+    mock_uvloop = MagicMock()
+    with (
+        patch.object(sys, "platform", "win32"),
+        patch.dict(sys.modules, {"winloop": mock_winloop, "uvloop": mock_uvloop}),
+    ):
+        install_event_loop()
+    mock_winloop.install.assert_called_once()
+    mock_uvloop.install.assert_not_called()
@@ -1,3 +1,4 @@
+import io
 from datetime import datetime
 from pathlib import Path
 
@@ -53,3 +54,41 @@ def test_markdown_save(sample_meeting: MeetingNote, tmp_path: Path) -> None:
     content = md_files[0].read_text()
     assert "# Test Meeting" in content
     assert "This is the raw transcript" in content
+
+
+def test_markdown_render_cached(sample_meeting: MeetingNote) -> None:
+    """Test that unchanged meetings reuse the rendered markdown."""
+    first = MarkdownRenderer.render(sample_meeting)
+    assert MarkdownRenderer.render(sample_meeting) is first
+
+    # Same length edit must not return the stale render
+    sample_meeting.raw_text = "This is the raw transcripT"
+    markdown = MarkdownRenderer.render(sample_meeting)
+    assert markdown is not first
+    assert "This is the raw transcripT" in markdown
+
+    # Appended lines and tail renders aren't served from the cache
+    sample_meeting.apply_delta({"text": "Next line", "sentence": False})
+    assert MarkdownRenderer.render(sample_meeting).endswith("Next line\n")
+    tail = MarkdownRenderer.render(sample_meeting, tail=1)
+    assert tail.endswith("*Earlier transcript lines are not shown*\n\nNext line\n")
+    assert MarkdownRenderer.render(sample_meeting, tail=1) is tail
+
+
+def test_markdown_render_to_matches_render(sample_meeting: MeetingNote) -> None:
+    """Test that streaming and string rendering produce the same output."""
+    out = io.StringIO()
+    MarkdownRenderer.render_to(sample_meeting, out)
+    assert out.getvalue() == MarkdownRenderer.render(sample_meeting)
+
+
+def test_markdown_render_tail(sample_meeting: MeetingNote) -> None:
+    """Test rendering only the last transcript lines."""
+    sample_meeting.raw_text = "Line 1\nLine 2\nLine 3"
+
+    markdown = MarkdownRenderer.render(sample_meeting, tail=2)
+
+    assert "Line 1" not in markdown
+    assert markdown.endswith("Line 2\nLine 3\n")
+    assert "Earlier transcript lines" in markdown
+    assert "Line 1" in MarkdownRenderer.render(sample_meeting)
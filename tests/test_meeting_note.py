@@ -4,7 +4,7 @@ from pathlib import Path
 
 import pytest
 
-from src.meeting_note import MeetingNote
+from src.meeting_note import MeetingNote, safe_title
 
 
 @pytest.fixture
@@ -55,6 +55,7 @@ def test_end_meeting(sample_meeting: MeetingNote) -> None:
     assert test_meeting.end_time == test_end
     assert test_meeting.duration == timedelta(hours=1)
     assert test_meeting.word_count == 2  # "Test content" has 2 words
+    assert test_meeting.metadata["date"] == test_meeting.start_time.strftime("%Y-%m-%d")
     assert test_meeting.metadata["duration"] == str(timedelta(hours=1))
     assert test_meeting.metadata["word_count"] == 2
     assert (
@@ -106,3 +107,181 @@ def test_word_count(sample_meeting: MeetingNote) -> None:
     sample_meeting.add_content("This is a test")
     sample_meeting.add_content("Another test message")
     assert sample_meeting.word_count == 7
+
+
+def test_append_delta_replayed_on_load(
+    sample_meeting: MeetingNote, tmp_path: Path
+) -> None:
+    """Test that appended transcript lines survive a reload."""
+    test_dir = tmp_path / "test_meetings"
+    sample_meeting.save(str(test_dir))
+    assert sample_meeting.file_path is not None
+
+    sample_meeting.append_delta({"text": "Hello there.", "sentence": True})
+    sample_meeting.append_delta({"text": "and then", "sentence": False})
+
+    loaded_meeting = MeetingNote.load(sample_meeting.file_path)
+    assert loaded_meeting.raw_text == "Hello there.\nand then"
+    assert loaded_meeting.content == ["Hello there."]
+
+
+def test_save_resets_delta_log(sample_meeting: MeetingNote, tmp_path: Path) -> None:
+    """Test that a full snapshot replaces the delta log."""
+    test_dir = tmp_path / "test_meetings"
+    sample_meeting.save(str(test_dir))
+    sample_meeting.append_delta({"text": "Hello there.", "sentence": True})
+    assert sample_meeting.delta_path is not None
+    assert os.path.exists(sample_meeting.delta_path)
+
+    sample_meeting.save(str(test_dir))
+
+    assert not os.path.exists(sample_meeting.delta_path)
+    assert sample_meeting.file_path is not None
+    loaded_meeting = MeetingNote.load(sample_meeting.file_path)
+    assert loaded_meeting.content == ["Hello there."]
+
+
+def test_interrupted_save_keeps_deltas_once(
+    sample_meeting: MeetingNote, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that logged deltas already in the snapshot aren't replayed."""
+    test_dir = tmp_path / "test_meetings"
+    sample_meeting.save(str(test_dir))
+    sample_meeting.append_delta({"text": "Hello there.", "sentence": True})
+    assert sample_meeting.file_path is not None
+
+    # Crash after the snapshot was swapped in, before the log was removed
+    def crash(path: str) -> None:
+        raise OSError("crashed")
+
+    monkeypatch.setattr(os, "remove", crash)
+    with pytest.raises(OSError):
+        sample_meeting.save(str(test_dir))
+    monkeypatch.undo()
+
+    loaded_meeting = MeetingNote.load(sample_meeting.file_path)
+    assert loaded_meeting.content == ["Hello there."]
+    assert loaded_meeting.raw_text == "Hello there."
+
+    # The next save clears the rotated log
+    loaded_meeting.append_delta({"text": "Bye.", "sentence": True})
+    loaded_meeting.save(str(test_dir))
+    assert not os.path.exists(f"{sample_meeting.file_path}.log.old")
+    assert MeetingNote.load(sample_meeting.file_path).content == [
+        "Hello there.",
+        "Bye.",
+    ]
+
+
+def test_delta_appended_during_save_kept(
+    sample_meeting: MeetingNote, tmp_path: Path
+) -> None:
+    """Test that a delta logged while a snapshot is written isn't lost."""
+    test_dir = tmp_path / "test_meetings"
+    sample_meeting.save(str(test_dir))
+    sample_meeting.append_delta({"text": "First.", "sentence": True})
+    to_dict = sample_meeting.to_dict
+
+    def append_after_copy() -> dict:
+        data = to_dict()
+        sample_meeting.append_delta({"text": "Second.", "sentence": True})
+        return data
+
+    sample_meeting.to_dict = append_after_copy  # type: ignore[method-assign]
+    sample_meeting.save(str(test_dir))
+
+    assert sample_meeting.file_path is not None
+    loaded_meeting = MeetingNote.load(sample_meeting.file_path)
+    assert loaded_meeting.content == ["First.", "Second."]
+
+
+def test_safe_title() -> None:
+    """Test that non-alphanumeric title characters are replaced."""
+    assert safe_title("Team Sync: Q1/Q2 ü") == "Team_Sync__Q1_Q2_ü"
+
+
+def test_update_file_path(sample_meeting: MeetingNote) -> None:
+    """Test that the file path drops punctuation and joins words with '_'."""
+    sample_meeting.title = "Team Sync: Q1/Q2! "
+    sample_meeting.update_file_path()
+
+    assert sample_meeting.file_path is not None
+    assert sample_meeting.file_path.endswith("_Team_Sync_Q1Q2.json")
+
+
+def test_update_file_path_moves_saved_meeting(
+    sample_meeting: MeetingNote, tmp_path: Path
+) -> None:
+    """Test that renaming a saved meeting takes its logged deltas along."""
+    test_dir = tmp_path / "test_meetings"
+    sample_meeting.save(str(test_dir))
+    sample_meeting.append_delta({"text": "Hello there.", "sentence": True})
+    old_path, old_delta_path = sample_meeting.file_path, sample_meeting.delta_path
+    assert old_path is not None and old_delta_path is not None
+
+    sample_meeting.title = "Renamed"
+    sample_meeting.update_file_path()
+
+    assert sample_meeting.file_path == str(test_dir / "20240101_100000_Renamed.json")
+    assert not os.path.exists(old_path)
+    assert not os.path.exists(old_delta_path)
+    assert os.listdir(test_dir) == ["20240101_100000_Renamed.json"]
+    loaded_meeting = MeetingNote.load(sample_meeting.file_path)
+    assert loaded_meeting.content == ["Hello there."]
+
+
+def test_raw_text_lines(sample_meeting: MeetingNote) -> None:
+    """Test that appended transcript lines read back as one text."""
+    sample_meeting.apply_delta({"text": "First", "sentence": False})
+    sample_meeting.apply_delta({"text": "Second.", "sentence": True})
+    assert sample_meeting.raw_text == "First\nSecond."
+    assert sample_meeting.raw_text == "First\nSecond."
+
+    sample_meeting.raw_text = "Replaced"
+    sample_meeting.apply_delta({"text": "Third", "sentence": False})
+    assert sample_meeting.raw_text == "Replaced\nThird"
+
+
+def test_raw_text_init_and_compact() -> None:
+    """Test that raw_text can be passed in and reads don't change the lines."""
+    meeting = MeetingNote(
+        title="Test Meeting", start_time=datetime(2024, 1, 1), raw_text="One"
+    )
+    meeting.apply_delta({"text": "Two", "sentence": False})
+
+    assert meeting.raw_text == "One\nTwo"
+    assert meeting.raw_lines == ["One", "Two"]
+
+    meeting.compact_lines()
+    assert meeting.raw_lines == ["One\nTwo"]
+    assert meeting.raw_text == "One\nTwo"
+
+
+def test_word_count_after_content_replaced(sample_meeting: MeetingNote) -> None:
+    """Test that the running word count follows changes to content."""
+    sample_meeting.add_content("one two")
+    assert sample_meeting.word_count == 2
+    sample_meeting.add_content("three")
+    assert sample_meeting.word_count == 3
+
+    sample_meeting.content = ["four"]
+    assert sample_meeting.word_count == 1
+
+    # A longer replacement isn't mistaken for appended lines
+    sample_meeting.content = ["five six", "seven eight nine"]
+    assert sample_meeting.word_count == 5
+    sample_meeting.end_meeting(sample_meeting.start_time + timedelta(minutes=1))
+    assert sample_meeting.metadata["word_count"] == 5
+
+
+def test_transcript_tail(sample_meeting: MeetingNote) -> None:
+    """Test reading the last transcript lines across joined and new lines."""
+    sample_meeting.raw_text = "One\nTwo\nThree"
+    sample_meeting.raw_lines.extend(["Four", "Five"])
+
+    assert sample_meeting.transcript_tail(2) == (True, "Four\nFive")
+    assert sample_meeting.transcript_tail(4) == (True, "Two\nThree\nFour\nFive")
+    assert sample_meeting.transcript_tail(5) == (False, "One\nTwo\nThree\nFour\nFive")
+    assert sample_meeting.transcript_tail(10) == (False, "One\nTwo\nThree\nFour\nFive")
+    # Reading the tail doesn't join the lines
+    assert len(sample_meeting.raw_lines) == 3
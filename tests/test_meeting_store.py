@@ -90,6 +90,19 @@ def test_list_meetings(meeting_store: MeetingStore) -> None:
     assert all(isinstance(m, MeetingNote) for m in meetings)
 
 
+def test_list_meetings_loads_from_disk(meeting_store: MeetingStore) -> None:
+    """Test that meetings saved by another store are loaded and cached."""
+    for title in ("Meeting 1", "Meeting 2", "Meeting 3"):
+        meeting_store.save_meeting(meeting_store.create_meeting(title))
+
+    other = MeetingStore(storage_dir=str(meeting_store.storage_dir))
+    meetings = other.list_meetings()
+
+    assert sorted(m.title for m in meetings) == ["Meeting 1", "Meeting 2", "Meeting 3"]
+    assert len(other.cached_meetings) == 3
+    assert len(other.search_meetings("meeting 2")) == 1
+
+
 def test_search_meetings(meeting_store: MeetingStore) -> None:
     """Test searching meetings."""
     # Create some test meetings
@@ -116,6 +129,75 @@ def test_search_meetings(meeting_store: MeetingStore) -> None:
     assert results[0].title == "Client Meeting"
 
 
+def test_search_meetings_partial_words(meeting_store: MeetingStore) -> None:
+    """Test that searches match inside and across words like a substring."""
+    meeting = meeting_store.create_meeting(
+        title="Client Meeting", participants=["Alice"], tags=[]
+    )
+    meeting_store.save_meeting(meeting)
+
+    assert len(meeting_store.search_meetings("lie")) == 1
+    assert len(meeting_store.search_meetings("nt meet")) == 1
+    assert meeting_store.search_meetings("meeting client") == []
+    assert len(meeting_store.search_meetings("")) == 1
+
+    # Renaming the current meeting updates the index and moves its file
+    meeting_store.update_current_meeting("Planning", participants=["Alice"])
+    assert meeting_store.search_meetings("client") == []
+    assert len(meeting_store.search_meetings("plan")) == 1
+    assert [m.title for m in meeting_store.list_meetings()] == ["Planning"]
+
+
+def test_search_meetings_sees_files_on_disk(
+    meeting_store: MeetingStore, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that searches pick up meetings saved or removed by others."""
+    assert meeting_store.search_meetings("review") == []
+
+    other = MeetingStore(storage_dir=str(meeting_store.storage_dir))
+    meeting = other.create_meeting("Design Review")
+    other.save_meeting(meeting)
+    other.save_meeting(other.create_meeting("Standup"))
+
+    results = meeting_store.search_meetings("review")
+    assert [m.title for m in results] == ["Design Review"]
+
+    # Unchanged files are only read once
+    def fail_load(file_path: str) -> MeetingNote:
+        raise AssertionError(f"Loaded {file_path}")
+
+    monkeypatch.setattr(MeetingNote, "load", fail_load)
+    assert meeting_store.search_meetings("review") == results
+    monkeypatch.undo()
+
+    assert meeting.file_path is not None
+    os.remove(meeting.file_path)
+    assert meeting_store.search_meetings("review") == []
+
+
+@pytest.mark.asyncio
+async def test_load_and_save_meetings_async(meeting_store: MeetingStore) -> None:
+    """Test loading and saving meetings from the event loop."""
+    other = MeetingStore(storage_dir=str(meeting_store.storage_dir))
+    for title in ("Meeting 1", "Meeting 2"):
+        other.save_meeting(other.create_meeting(title))
+
+    meetings = await meeting_store.load_meetings()
+    assert sorted(m.title for m in meetings) == ["Meeting 1", "Meeting 2"]
+    assert len(meeting_store.cached_meetings) == 2
+
+    meeting = meetings[0]
+    assert meeting.file_path is not None
+    assert await meeting_store.load_meetings([meeting.file_path, "missing.json"]) == [
+        meeting
+    ]
+
+    meeting.summary = "Summary"
+    await meeting_store.save_meeting_async(meeting)
+    assert MeetingNote.load(meeting.file_path).summary == "Summary"
+    assert meeting_store.load_meeting(meeting.file_path) is meeting
+
+
 def test_caching(meeting_store: MeetingStore, sample_meeting: MeetingNote) -> None:
     # Save meeting
     meeting_store.save_meeting(sample_meeting)
@@ -130,6 +212,41 @@ def test_caching(meeting_store: MeetingStore, sample_meeting: MeetingNote) -> No
     assert meeting1 is meeting2
 
 
+def test_cache_reloads_modified_file(
+    meeting_store: MeetingStore, sample_meeting: MeetingNote
+) -> None:
+    """Test that a cached meeting is reloaded after its file changes."""
+    meeting_store.save_meeting(sample_meeting)
+    assert sample_meeting.file_path is not None
+
+    other = MeetingStore(storage_dir=str(meeting_store.storage_dir))
+    cached = other.load_meeting(sample_meeting.file_path)
+    assert cached is not None
+
+    sample_meeting.title = "Renamed"
+    sample_meeting.save()
+    stat = os.stat(sample_meeting.file_path)
+    os.utime(sample_meeting.file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+    reloaded = other.load_meeting(sample_meeting.file_path)
+    assert reloaded is not None and reloaded is not cached
+    assert reloaded.title == "Renamed"
+
+
+def test_cache_evicts_least_recently_used(meeting_store: MeetingStore) -> None:
+    """Test that the meeting cache is bounded."""
+    meeting_store.max_cached_meetings = 2
+    for title in ("Meeting 1", "Meeting 2", "Meeting 3"):
+        meeting_store.save_meeting(meeting_store.create_meeting(title))
+
+    assert [m.title for m in meeting_store.cached_meetings.values()] == [
+        "Meeting 2",
+        "Meeting 3",
+    ]
+    assert len(meeting_store.list_meetings()) == 3
+    assert len(meeting_store.cached_meetings) == 2
+
+
 def test_add_content_without_meeting(meeting_store: MeetingStore) -> None:
     """Test adding content when no meeting is active."""
     # Should not raise an error, just log a warning
@@ -169,3 +286,40 @@ def test_create_sample_meeting(tmp_path: Path) -> None:
         storage_dir=str(tmp_path / "meetings2"), create_sample=False
     )
     assert store_no_sample.current_meeting is None
+
+
+def test_add_content_appends_delta(meeting_store: MeetingStore) -> None:
+    """Test that transcript lines are appended instead of rewriting the file."""
+    meeting_store.create_meeting("Test Meeting")
+    meeting_store.add_content("First line.")
+    meeting = meeting_store.current_meeting
+    assert meeting is not None and meeting.file_path is not None
+    snapshot = Path(meeting.file_path).read_text(encoding="utf-8")
+
+    meeting_store.add_content("Second line.")
+
+    # Snapshot untouched, new line only in the delta log
+    assert Path(meeting.file_path).read_text(encoding="utf-8") == snapshot
+    assert meeting.delta_path is not None
+    assert "Second line." in Path(meeting.delta_path).read_text(encoding="utf-8")
+
+    loaded = MeetingNote.load(meeting.file_path)
+    assert loaded.raw_text == "First line.\nSecond line."
+
+
+def test_add_content_takes_periodic_snapshot(meeting_store: MeetingStore) -> None:
+    """Test that a full snapshot is written every snapshot_every lines."""
+    meeting_store.snapshot_every = 3
+    meeting_store.create_meeting("Test Meeting")
+    for i in range(3):
+        meeting_store.add_content(f"Line {i}.")
+
+    meeting = meeting_store.current_meeting
+    assert meeting is not None and meeting.delta_path is not None
+    assert not os.path.exists(meeting.delta_path)
+    assert meeting.file_path is not None
+    assert MeetingNote.load(meeting.file_path).content == [
+        "Line 0.",
+        "Line 1.",
+        "Line 2.",
+    ]
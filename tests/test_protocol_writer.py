@@ -1,4 +1,5 @@
 import os
+import re
 from datetime import datetime
 from pathlib import Path
 from typing import Generator
@@ -6,6 +7,7 @@ from typing import Generator
 import pytest
 from pytest import FixtureRequest
 
+from src.meeting_store import MeetingStore
 from src.protocol_writer import ProtocolWriter
 
 
@@ -31,6 +33,7 @@ def test_protocol_writer_writes_entry(protocol_writer: ProtocolWriter) -> None:
     test_text = "Test transcription"
     protocol_writer.start_protocol()
     protocol_writer.write_entry(test_text)
+    protocol_writer.flush()
 
     with open(protocol_writer.output_file, "r", encoding="utf-8") as f:
         content = f.read()
@@ -38,6 +41,16 @@ def test_protocol_writer_writes_entry(protocol_writer: ProtocolWriter) -> None:
         assert datetime.now().strftime("%Y-%m-%d") in content
 
 
+def test_protocol_writer_entry_timestamp(protocol_writer: ProtocolWriter) -> None:
+    """Test that entries are prefixed with a zero padded time."""
+    protocol_writer.start_protocol()
+    protocol_writer.write_entry("Timed entry")
+    protocol_writer.flush()
+
+    content = Path(protocol_writer.output_file).read_text(encoding="utf-8")
+    assert re.search(r"^\[\d{2}:\d{2}:\d{2}\] Timed entry$", content, re.MULTILINE)
+
+
 def test_protocol_writer_close(protocol_writer: ProtocolWriter) -> None:
     """Test closing the protocol."""
     protocol_writer.start_protocol()
@@ -47,6 +60,7 @@ def test_protocol_writer_close(protocol_writer: ProtocolWriter) -> None:
     with open(protocol_writer.output_file, "r", encoding="utf-8") as f:
         content = f.read()
         assert "Protocol ended" in content
+        assert "Test entry" in content
 
 
 def test_protocol_writer_multiple_entries(protocol_writer: ProtocolWriter) -> None:
@@ -56,6 +70,7 @@ def test_protocol_writer_multiple_entries(protocol_writer: ProtocolWriter) -> No
 
     for entry in entries:
         protocol_writer.write_entry(entry)
+    protocol_writer.flush()
 
     with open(protocol_writer.output_file, "r", encoding="utf-8") as f:
         content = f.read()
@@ -66,10 +81,40 @@ def test_protocol_writer_multiple_entries(protocol_writer: ProtocolWriter) -> No
 def test_protocol_writer_header_format(protocol_writer: ProtocolWriter) -> None:
     """Test protocol header format."""
     protocol_writer.start_protocol()
-    if protocol_writer.file_handle is not None:  # Add null check
-        protocol_writer.file_handle.flush()
+    protocol_writer.flush()
 
     with open(protocol_writer.output_file, "r", encoding="utf-8") as f:
         content = f.read()
         assert "Protocol - " in content
         assert "=" * 50 in content
+
+
+def test_protocol_writer_batches_flushes(protocol_writer: ProtocolWriter) -> None:
+    """Test that entries are flushed in batches."""
+    protocol_writer.flush_every = 3
+    protocol_writer.start_protocol()
+
+    protocol_writer.write_entry("Entry 1")
+    protocol_writer.write_entry("Entry 2")
+    with open(protocol_writer.output_file, "r", encoding="utf-8") as f:
+        assert "Entry 1" not in f.read()
+
+    protocol_writer.write_entry("Entry 3")
+    with open(protocol_writer.output_file, "r", encoding="utf-8") as f:
+        content = f.read()
+        assert "Entry 1" in content
+        assert "Entry 3" in content
+
+
+def test_protocol_writer_forwards_text_to_store(tmp_path: Path) -> None:
+    """Test that the meeting store receives the text without timestamp."""
+    store = MeetingStore(storage_dir=str(tmp_path / "meetings"))
+    store.create_meeting("Protocol Meeting")
+    writer = ProtocolWriter(str(tmp_path / "protocol.txt"), meeting_store=store)
+    writer.start_protocol()
+    writer.write_entry("Hello there.")
+    writer.close_protocol()
+
+    assert store.current_meeting is not None
+    assert store.current_meeting.raw_text == "Hello there."
+    assert store.current_meeting.content == ["Hello there."]
@@ -1,11 +1,13 @@
 import asyncio
-from typing import Generator
+from typing import Callable, Generator, List
 from unittest.mock import MagicMock, patch, Mock
 
+import azure.cognitiveservices.speech as speechsdk
 import pytest
 
 from src.config import Config
 from src.speech_transcriber import SpeechTranscriber
+from src.state.app_state import TranscriptionLanguage
 
 
 @pytest.fixture(scope="function")
@@ -45,8 +47,8 @@ def mock_speech_sdk() -> Generator[dict[str, Mock], None, None]:
 def transcriber(mock_config: MagicMock, mock_speech_sdk: dict) -> SpeechTranscriber:
     """Create a transcriber with mocked components."""
     with patch("os.getenv") as mock_getenv:
-        mock_getenv.side_effect = (
-            lambda key: "test_key" if key == "AZURE_SPEECH_KEY" else "test_region"
+        mock_getenv.side_effect = lambda key: (
+            "test_key" if key == "AZURE_SPEECH_KEY" else "test_region"
         )
         transcriber = SpeechTranscriber(mock_config)
         return transcriber
@@ -67,6 +69,8 @@ async def test_start_transcription(mock_speech_sdk: dict[str, Mock]) -> None:
     # Verify recognizer was started
     transcriber.speech_recognizer.start_continuous_recognition_async.assert_called_once()
 
+    await transcriber.stop_transcription()
+
 
 @pytest.mark.asyncio
 async def test_stop_transcription(mock_speech_sdk: dict[str, Mock]) -> None:
@@ -81,20 +85,168 @@ async def test_stop_transcription(mock_speech_sdk: dict[str, Mock]) -> None:
 
 @pytest.mark.asyncio
 async def test_queue_transfer(transcriber: SpeechTranscriber) -> None:
-    """Test that text is properly transferred between queues."""
+    """Test that recognized text reaches the async queue from the SDK thread."""
     transcriber.start_transcription()
+    handle_result = transcriber.speech_recognizer.recognized.connect.call_args[0][0]
 
-    # Put a test message in the thread queue
-    test_text = "Test message"
-    transcriber._thread_queue.put(test_text)
+    evt = Mock()
+    evt.result.reason = speechsdk.ResultReason.RecognizedSpeech
+    evt.result.text = "Test message"
 
-    # Wait a short time for transfer
-    await asyncio.sleep(0.2)
+    # The SDK invokes the callback on its own thread
+    await asyncio.to_thread(handle_result, evt)
 
-    # Check that message was transferred to async queue
-    assert not transcriber._async_queue.empty()
-    received_text = await transcriber._async_queue.get()
-    assert received_text == test_text
+    queue = transcriber.get_transcript_queue()
+    received_text = await asyncio.wait_for(queue.get(), timeout=1.0)
+    assert received_text == "Test message"
 
     # Clean up
     await transcriber.stop_transcription()
+
+
+def test_set_language_reuses_recognizers(
+    transcriber: SpeechTranscriber, mock_speech_sdk: dict[str, Mock]
+) -> None:
+    """Test that switching languages builds each recognizer only once."""
+    mock_speech_sdk["recognizer"].side_effect = lambda **_: Mock()
+    english = transcriber.speech_recognizer
+
+    transcriber.set_language(TranscriptionLanguage.GERMAN)
+    german = transcriber.speech_recognizer
+    assert german is not english
+
+    transcriber.set_language(TranscriptionLanguage.ENGLISH)
+    assert transcriber.speech_recognizer is english
+    transcriber.set_language(TranscriptionLanguage.GERMAN)
+    assert transcriber.speech_recognizer is german
+    # One recognizer for English at startup, one for German
+    assert mock_speech_sdk["recognizer"].call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_utterances_coalesced(transcriber: SpeechTranscriber) -> None:
+    """Test that utterances within the coalescing window are queued as one."""
+    transcriber.coalesce_window = 10.0
+    transcriber.start_transcription()
+    handle_result = transcriber.speech_recognizer.recognized.connect.call_args[0][0]
+
+    for text in ("First.", "Second."):
+        evt = Mock()
+        evt.result.reason = speechsdk.ResultReason.RecognizedSpeech
+        evt.result.text = text
+        await asyncio.to_thread(handle_result, evt)
+
+    queue = transcriber.get_transcript_queue()
+    assert queue.empty()
+
+    # Stopping flushes the window instead of dropping the text
+    await transcriber.stop_transcription()
+    received_text = await asyncio.wait_for(queue.get(), timeout=1.0)
+    assert received_text == "First. Second."
+    assert queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_recognition_stats_logged(transcriber: SpeechTranscriber) -> None:
+    """Test that recognized utterances are counted and logged periodically."""
+    transcriber.logger = Mock()
+    transcriber.stats_interval = 0.01
+    transcriber.start_transcription()
+    handle_result = transcriber.speech_recognizer.recognized.connect.call_args[0][0]
+
+    for text in ("One", "Two"):
+        evt = Mock()
+        evt.result.reason = speechsdk.ResultReason.RecognizedSpeech
+        evt.result.text = text
+        handle_result(evt)
+
+    await asyncio.sleep(0.05)
+    transcriber.logger.info.assert_any_call("Recognized 2 utterances in the last 0.01s")
+
+    await transcriber.stop_transcription()
+
+
+def cancel_event() -> Mock:
+    """A recognition result reporting that recognition was canceled."""
+    evt = Mock()
+    evt.result.reason = speechsdk.ResultReason.Canceled
+    return evt
+
+
+@pytest.mark.asyncio
+async def test_stop_after_cancel_stops_stats(transcriber: SpeechTranscriber) -> None:
+    """Test that stopping after a Canceled event still ends the stats task."""
+    transcriber.start_transcription()
+    stats_task = transcriber._stats_task
+    assert stats_task is not None
+    handle_result = transcriber.speech_recognizer.recognized.connect.call_args[0][0]
+
+    handle_result(cancel_event())
+    await transcriber.stop_transcription()
+    await asyncio.sleep(0)
+
+    assert stats_task.cancelled()
+    assert transcriber._stats_task is None
+
+
+@pytest.mark.asyncio
+async def test_stop_after_cancel_flushes(transcriber: SpeechTranscriber) -> None:
+    """Test that stopping after a Canceled event queues the pending text."""
+    transcriber.coalesce_window = 10.0
+    transcriber.start_transcription()
+    handle_result = transcriber.speech_recognizer.recognized.connect.call_args[0][0]
+
+    evt = Mock()
+    evt.result.reason = speechsdk.ResultReason.RecognizedSpeech
+    evt.result.text = "Last words."
+    await asyncio.to_thread(handle_result, evt)
+    handle_result(cancel_event())
+    await transcriber.stop_transcription()
+
+    queue = transcriber.get_transcript_queue()
+    assert await asyncio.wait_for(queue.get(), timeout=1.0) == "Last words."
+    # Text recognized after stopping isn't queued
+    await asyncio.to_thread(handle_result, evt)
+    await asyncio.sleep(0)
+    assert queue.empty()
+
+
+class FakeSignal:
+    """Stand-in for an SDK event signal that keeps its connected handlers."""
+
+    def __init__(self) -> None:
+        self.handlers: List[Callable[[Mock], None]] = []
+
+    def connect(self, handler: Callable[[Mock], None]) -> None:
+        self.handlers.append(handler)
+
+    def disconnect_all(self) -> None:
+        self.handlers.clear()
+
+    def emit(self, evt: Mock) -> None:
+        for handler in self.handlers:
+            handler(evt)
+
+
+@pytest.mark.asyncio
+async def test_restart_after_cancel_queues_once(
+    transcriber: SpeechTranscriber,
+) -> None:
+    """Test that a restart after a cancel doesn't connect a second handler."""
+    signal = FakeSignal()
+    transcriber.speech_recognizer.recognized = signal
+    transcriber.start_transcription()
+
+    signal.emit(cancel_event())
+    await transcriber.stop_transcription()
+    transcriber.start_transcription()
+
+    evt = Mock()
+    evt.result.reason = speechsdk.ResultReason.RecognizedSpeech
+    evt.result.text = "Hello."
+    await asyncio.to_thread(signal.emit, evt)
+    await transcriber.stop_transcription()
+
+    queue = transcriber.get_transcript_queue()
+    assert await asyncio.wait_for(queue.get(), timeout=1.0) == "Hello."
+    assert queue.empty()
@@ -35,7 +35,7 @@ async def mock_components() -> dict:
 def create_mock_config() -> Mock:
     """Create a mock config component."""
     mock_config = Mock()
-    mock_config.config.get.return_value = {
+    mock_config.get_audio_settings.return_value = {
         "enabled": True,
         "format": pyaudio.paFloat32,
         "channels": 1,
@@ -141,7 +141,13 @@ def create_mock_store() -> Mock:
 def create_mock_queue() -> Mock:
     """Create a mock queue."""
     mock_queue = Mock(spec=asyncio.Queue)
-    mock_queue.get = AsyncMock(side_effect=asyncio.TimeoutError)
+
+    async def wait_for_text() -> str:
+        # Nothing is ever transcribed, block like an empty queue
+        await asyncio.Event().wait()
+        return ""
+
+    mock_queue.get = AsyncMock(side_effect=wait_for_text)
     mock_queue.put = AsyncMock()
     return mock_queue
 
@@ -151,7 +157,7 @@ def create_mock_state() -> Mock:
     mock_state = Mock()
     # Make toggle_language return a coroutine
     mock_state.toggle_language = AsyncMock()
-    mock_state.can_toggle_language = AsyncMock(return_value=True)
+    mock_state.can_toggle_language = Mock(return_value=True)
     return mock_state
 
 
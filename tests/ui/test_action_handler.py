@@ -1,5 +1,6 @@
 import logging
 from datetime import datetime
+from typing import AsyncIterator, List
 from unittest.mock import Mock, AsyncMock
 from unittest.mock import call
 
@@ -10,6 +11,12 @@ from src.meeting_note import MeetingNote
 from src.ui.action_handler import ActionHandler
 
 
+async def stream_pieces(pieces: List[str]) -> AsyncIterator[str]:
+    """Stand-in for OpenAIService.stream_summary."""
+    for piece in pieces:
+        yield piece
+
+
 @pytest.fixture
 def mock_app() -> Mock:
     """Create a mock app with required attributes and methods."""
@@ -30,7 +37,7 @@ def mock_app() -> Mock:
 
     # Add state mock with async methods
     app.state = Mock()
-    app.state.can_generate_summary = AsyncMock()
+    app.state.can_generate_summary = Mock()
     app.state.toggle_summarizing = AsyncMock()
     app.state.toggle_language = AsyncMock()
 
@@ -180,28 +187,83 @@ async def test_summarize(action_handler: ActionHandler, mock_app: Mock) -> None:
     mock_meeting.save = Mock()
 
     mock_app.meeting_store.current_meeting = mock_meeting
-    mock_app.openai_service.generate_summary = AsyncMock(return_value="Test summary")
-    mock_app.state.can_generate_summary = AsyncMock(return_value=True)
+    mock_app.openai_service.stream_summary = Mock(
+        side_effect=lambda data: stream_pieces(["Test ", "summary"])
+    )
+    mock_app.state.can_generate_summary = Mock(return_value=True)
     mock_app.state.toggle_summarizing = AsyncMock()
 
     await action_handler.summarize()
 
     # Verify the summary was generated and saved
     mock_app.state.toggle_summarizing.assert_has_awaits([call(True), call(False)])
-    mock_app.openai_service.generate_summary.assert_awaited_once()
+    mock_app.openai_service.stream_summary.assert_called_once()
+    assert mock_meeting.summary == "Test summary"
     mock_meeting.save.assert_called_once()
     mock_app.notify.assert_called_with(
         "Summary generated successfully!", title="📝 Summary"
     )
 
 
+@pytest.mark.asyncio
+async def test_summarize_stream_error_keeps_summary(
+    action_handler: ActionHandler, mock_app: Mock
+) -> None:
+    """Test that a failed stream doesn't leave a partial summary behind."""
+
+    async def failing_stream(data: dict) -> AsyncIterator[str]:
+        yield "Partial"
+        raise RuntimeError("Error generating summary: API Error")
+
+    mock_meeting = Mock()
+    mock_meeting.start_time = datetime.now()
+    mock_meeting.participants = []
+    mock_meeting.summary = "Old summary"
+    mock_app.meeting_store.current_meeting = mock_meeting
+    mock_app.openai_service.stream_summary = failing_stream
+    mock_app.state.can_generate_summary = Mock(return_value=True)
+    action_handler.summary_refresh_every = 1
+
+    await action_handler.summarize()
+
+    assert mock_meeting.summary == "Old summary"
+    mock_meeting.save.assert_not_called()
+    mock_app.notify.assert_called_with("Failed to generate summary", title="❌ Error")
+
+
+@pytest.mark.asyncio
+async def test_summarize_shows_sentences(
+    action_handler: ActionHandler, mock_app: Mock
+) -> None:
+    """Test that a redraw is scheduled once a sentence is complete."""
+    mock_meeting = Mock()
+    mock_meeting.start_time = datetime.now()
+    mock_meeting.participants = []
+    mock_app.meeting_store.current_meeting = mock_meeting
+    mock_app.openai_service.stream_summary = Mock(
+        side_effect=lambda data: stream_pieces(["One", " two.", " Three", " four"])
+    )
+    mock_app.state.can_generate_summary = Mock(return_value=True)
+    scheduled: List[str] = []
+    mock_app.schedule_render = Mock(
+        side_effect=lambda: scheduled.append(mock_meeting.summary)
+    )
+
+    await action_handler.summarize()
+
+    assert scheduled == ["One two."]
+    # The finished summary is rendered right away
+    mock_app.render_meeting.assert_called_once()
+    assert mock_meeting.summary == "One two. Three four"
+
+
 @pytest.mark.asyncio
 async def test_summarize_not_allowed(
     action_handler: ActionHandler, mock_app: Mock
 ) -> None:
     """Test summarize action when not allowed."""
     mock_app.meeting_store.current_meeting = Mock()
-    mock_app.state.can_generate_summary = AsyncMock(return_value=False)
+    mock_app.state.can_generate_summary = Mock(return_value=False)
 
     await action_handler.summarize()
     mock_app.notify.assert_called_with(
@@ -209,6 +271,58 @@ async def test_summarize_not_allowed(
     )
 
 
+@pytest.mark.asyncio
+async def test_summarize_all(action_handler: ActionHandler, mock_app: Mock) -> None:
+    """Test submitting a summary batch and saving its results."""
+    meeting = MeetingNote(
+        title="Stored Meeting",
+        start_time=datetime(2024, 1, 1, 10, 0),
+        file_path="meetings/stored.json",
+    )
+    # The meeting being recorded already has a summary and is left alone
+    current = MeetingNote(
+        title="Current Meeting",
+        start_time=datetime(2024, 1, 2, 10, 0),
+        file_path="meetings/current.json",
+        summary="Live summary",
+    )
+    mock_app.meeting_store.current_meeting = current
+    mock_app.meeting_store.load_meetings = AsyncMock(return_value=[current, meeting])
+    mock_app.meeting_store.save_meeting_async = AsyncMock()
+    mock_app.openai_service.submit_summary_batch = AsyncMock(return_value="batch-1")
+
+    # First call submits the batch
+    await action_handler.summarize_all()
+    submitted = mock_app.openai_service.submit_summary_batch.await_args.args[0]
+    assert list(submitted) == ["meetings/stored.json"]
+    assert action_handler.summary_batch_id == "batch-1"
+
+    # Later calls wait for the batch to complete
+    mock_app.openai_service.poll_batch = AsyncMock(
+        return_value=Mock(id="batch-1", status="in_progress", output_file_id=None)
+    )
+    await action_handler.summarize_all()
+    mock_app.notify.assert_called_with(
+        "Summary batch is in_progress", title="📝 Summary"
+    )
+
+    mock_app.openai_service.poll_batch.return_value = Mock(
+        id="batch-1", status="completed", output_file_id="file-out"
+    )
+    mock_app.openai_service.retrieve_batch_results = AsyncMock(
+        return_value={
+            "meetings/stored.json": "Batch summary",
+            "meetings/current.json": "Stale summary",
+        }
+    )
+    await action_handler.summarize_all()
+
+    assert meeting.summary == "Batch summary"
+    assert current.summary == "Live summary"
+    mock_app.meeting_store.save_meeting_async.assert_awaited_once_with(meeting)
+    assert action_handler.summary_batch_id is None
+
+
 def test_toggle_log_level(action_handler: ActionHandler, mock_app: Mock) -> None:
     """Test log level toggle."""
     # Mock the current log level
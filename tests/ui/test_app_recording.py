@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import AsyncGenerator, Any
 from unittest.mock import Mock, AsyncMock
 from typing import cast
@@ -5,6 +6,7 @@ from typing import cast
 import pytest
 import pytest_asyncio
 
+from src.meeting_note import MeetingNote
 from src.state.app_state import RecordingState
 from src.ui.app import TranscriberUI
 
@@ -45,7 +47,7 @@ async def test_start_recording(app: TranscriberUI) -> None:
 
     await app.start_recording("Test Meeting")
 
-    state = await app.state.get_state()
+    state = app.state.get_state()
     assert state.recording_state == RecordingState.RECORDING
     assert app.recording is True
     assert app.paused is False
@@ -62,7 +64,7 @@ async def test_stop_recording(app: TranscriberUI) -> None:
     await app.stop_recording()
 
     # Check state updates
-    state = await app.state.get_state()
+    state = app.state.get_state()
     assert state.recording_state == RecordingState.STOPPED
     assert app.recording is False
     assert app.transcriber.stop_transcription.await_count == 1
@@ -73,14 +75,14 @@ async def test_pause_resume_recording(app: TranscriberUI) -> None:
     """Test pausing and resuming recording."""
     # Start recording
     await app.start_recording("Test Meeting")
-    state = await app.state.get_state()
+    state = app.state.get_state()
     assert state.recording_state == RecordingState.RECORDING
     assert app.recording is True
     assert app.paused is False
 
     # Pause recording
     await app.pause_recording()
-    state = await app.state.get_state()
+    state = app.state.get_state()
     assert state.recording_state == RecordingState.PAUSED
     assert app.paused is True
     assert app.recording is True
@@ -91,7 +93,7 @@ async def test_pause_resume_recording(app: TranscriberUI) -> None:
 
     # Resume recording
     await app.resume_recording()
-    state = await app.state.get_state()
+    state = app.state.get_state()
     assert state.recording_state == RecordingState.RECORDING
     assert app.paused is False
     assert app.recording is True
@@ -109,7 +111,7 @@ async def test_recording_cleanup_on_error(app: TranscriberUI) -> None:
         await app.start_recording("Test Meeting")
 
     # Check proper cleanup occurred
-    state = await app.state.get_state()
+    state = app.state.get_state()
     assert state.recording_state == RecordingState.STOPPED
     assert not state.is_processing
     assert app.recording is False
@@ -121,13 +123,38 @@ async def test_recording_state_during_processing(app: TranscriberUI) -> None:
     """Test state handling during recording processing."""
     # Start recording
     await app.start_recording("Test Meeting")
-    state = await app.state.get_state()
+    state = app.state.get_state()
     assert state.is_processing is False
 
     # Stop recording
     await app.stop_recording()
-    state = await app.state.get_state()
+    state = app.state.get_state()
     assert state.is_processing is False
 
 
+@pytest.mark.asyncio
+async def test_render_appends_new_lines(app: TranscriberUI) -> None:
+    """Test that long meetings append lines instead of redrawing the view."""
+    meeting = MeetingNote(title="Test Meeting", start_time=datetime(2024, 1, 1))
+    app.meeting_store.current_meeting = meeting
+    app.render_window = 3
+    content = Mock()
+    app._meeting_content = content
+
+    app.render_meeting()
+    for i in range(6):
+        meeting.apply_delta({"text": f"Line {i}", "sentence": False})
+        app.render_meeting()
+
+    # Drawn once without a transcript, then appended to past the window
+    assert content.clear.call_count == 2
+    content.write.assert_called_with("Line 5\n")
+
+    # Grown to twice the window, redrawn with the window only
+    meeting.apply_delta({"text": "Line 6", "sentence": False})
+    app.render_meeting()
+    assert content.clear.call_count == 3
+    assert content.write.call_args.args[0].endswith("Line 4\nLine 5\nLine 6\n")
+
+
 # ... more recording-related tests ...
@@ -30,14 +30,14 @@ def mock_app() -> Mock:
     """Create a mock app for testing."""
     app = Mock()
     app.state = Mock()
-    app.state.can_toggle_language = AsyncMock(return_value=True)
+    app.state.can_toggle_language = Mock(return_value=True)
     app.state.toggle_language = AsyncMock(return_value=TranscriptionLanguage.GERMAN)
     app.notify = Mock()
 
     # Instead of making action_toggle_language a simple AsyncMock,
     # implement its actual behavior
     async def mock_action_toggle_language() -> None:
-        if await app.state.can_toggle_language():
+        if app.state.can_toggle_language():
             language = await app.state.toggle_language()
             button = app.query_one("#language_toggle")
             button.label = "🇩🇪" if language == TranscriptionLanguage.GERMAN else "🇺🇸"
@@ -86,7 +86,7 @@ async def test_language_button_disabled_states(
     """Test language button disabled states."""
     # Setup
     mock_app.query_one = Mock(return_value=mock_language_toggle)
-    mock_app.state.can_toggle_language = AsyncMock(return_value=False)
+    mock_app.state.can_toggle_language = Mock(return_value=False)
 
     # Execute
     await mock_app.action_toggle_language()
@@ -119,7 +119,7 @@ async def test_language_toggle_blocked_notification(
     """Test blocked language toggle notification."""
     # Setup
     mock_app.query_one = Mock(return_value=mock_language_toggle)
-    mock_app.state.can_toggle_language = AsyncMock(return_value=False)
+    mock_app.state.can_toggle_language = Mock(return_value=False)
 
     # Execute
     await mock_app.action_toggle_language()
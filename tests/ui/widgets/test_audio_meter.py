@@ -1,4 +1,3 @@
-from collections import deque
 from typing import Generator
 from unittest.mock import Mock
 
@@ -71,9 +70,7 @@ def test_render_line_plot(audio_meter: AudioMeter) -> None:
     # Set up test data
     audio_meter.level = 0.5
     audio_meter.max_level = 0.7
-    audio_meter.history = deque(
-        [0.5] * audio_meter.history_size, maxlen=audio_meter.history_size
-    )
+    audio_meter.history[:] = 0.5
 
     # Test rendering plot lines
     for y in range(audio_meter._size.height):
@@ -99,3 +96,61 @@ def test_level_decay(audio_meter: AudioMeter, mock_app_context: Mock) -> None:
 
     assert audio_meter.level < 1.0
     assert audio_meter._dynamic_max < 1.0
+
+
+def test_plot_rebuilt_when_history_moves(
+    audio_meter: AudioMeter, mock_app_context: Mock
+) -> None:
+    """Test that the cached plot is dropped even if the level is unchanged."""
+    audio_meter.render_line(0)
+    assert audio_meter._plot_render_cache is not None
+
+    # Silence keeps the level at 0.0, so watch_level doesn't run
+    audio_meter.last_update = 0
+    audio_meter.update_level(np.zeros(1024, dtype=np.float32).tobytes())
+
+    assert audio_meter.level == 0.0
+    assert audio_meter._plot_render_cache is None
+
+
+def test_render_rows_blocks(audio_meter: AudioMeter) -> None:
+    """Test that levels are drawn as blocks with the peak line above them."""
+    audio_meter.history = np.array([0.0, 0.5], dtype=np.float32)
+    audio_meter.max_history = np.array([0.5, 0.5], dtype=np.float32)
+
+    # The scale tops out at 0.6, so 0.5 fills 20 of 24 eighths
+    rows = [strip.text for strip in audio_meter._render_rows(4, 3)]
+
+    assert rows == ["──▄▄", "  ██", "  ██"]
+
+
+def test_update_level_skips_chunks_between_updates(
+    audio_meter: AudioMeter, mock_app_context: Mock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that chunks within update_interval are not decoded."""
+    compute_rms = Mock(return_value=0.5)
+    monkeypatch.setattr("src.ui.widgets.audio_meter.compute_rms", compute_rms)
+    audio = np.ones(1024, dtype=np.float32).tobytes()
+
+    audio_meter.last_update = 0
+    audio_meter.update_level(audio)
+    audio_meter.update_level(audio)
+
+    compute_rms.assert_called_once()
+
+
+def test_history_ring_buffer(audio_meter: AudioMeter, mock_app_context: Mock) -> None:
+    """Test that new levels overwrite the oldest and are drawn on the right."""
+    audio_meter.history = np.array([0.5, 0.0], dtype=np.float32)
+    audio_meter.max_history = np.array([0.5, 0.5], dtype=np.float32)
+    audio_meter._head = 1
+
+    rows = [strip.text for strip in audio_meter._render_rows(4, 3)]
+
+    assert rows == ["──▄▄", "  ██", "  ██"]
+
+    audio_meter.last_update = 0
+    audio_meter.update_level(np.zeros(1024, dtype=np.float32).tobytes())
+
+    assert audio_meter._head == 0
+    assert audio_meter.history.tolist() == [0.5, 0.0]